@@ -16,11 +16,51 @@ class Settings(BaseSettings):
     google_api_key: str = Field(..., alias="GEMINI_API_KEY")
     google_project_id: str | None = Field(None, alias="GOOGLE_PROJECT_ID")
     gemini_model_name: str = Field("models/gemini-2.5-flash", alias="GEMINI_MODEL_NAME")
+    gemini_lite_model_name: str = Field("models/gemini-2.5-flash-lite", alias="GEMINI_LITE_MODEL_NAME")
+    gemini_strong_model_name: str = Field("models/gemini-2.5-pro", alias="GEMINI_STRONG_MODEL_NAME")
+    # Comma-separated models tried, in order, after a route's primary model fails.
+    gemini_fallback_models: str = Field("", alias="GEMINI_FALLBACK_MODELS")
+    ranking_max_output_tokens: int = Field(1024, alias="RANKING_MAX_OUTPUT_TOKENS")
+    summary_max_output_tokens: int = Field(200, alias="SUMMARY_MAX_OUTPUT_TOKENS")
+    # Heuristic top-two score gap below which a ranking is routed to the strong model.
+    ranking_ambiguity_margin: float = Field(0.1, alias="RANKING_AMBIGUITY_MARGIN")
+    ranking_latency_budget_ms: float | None = Field(None, alias="RANKING_LATENCY_BUDGET_MS")
+    summary_latency_budget_ms: float | None = Field(None, alias="SUMMARY_LATENCY_BUDGET_MS")
+
+    # Build roadmap + summary for the heuristic top role while LLM ranking runs (see graph builder).
+    speculative_pipeline: bool = Field(False, alias="SPECULATIVE_PIPELINE")
+
+    # "off", "record" (save Gemini exchanges) or "replay" (serve them offline).
+    llm_cassette_mode: str = Field("off", alias="LLM_CASSETTE_MODE")
+    llm_cassette_path: str = Field("cassettes/llm_cassette.jsonl.gz", alias="LLM_CASSETTE_PATH")
+    # "realistic" sleeps for the recorded latency during replay, "zero" skips it.
+    llm_replay_latency: str = Field("realistic", alias="LLM_REPLAY_LATENCY")
+
+    llm_breaker_failure_rate: float = Field(0.5, alias="LLM_BREAKER_FAILURE_RATE")
+    llm_breaker_window_seconds: float = Field(60.0, alias="LLM_BREAKER_WINDOW_SECONDS")
+    llm_breaker_min_calls: int = Field(4, alias="LLM_BREAKER_MIN_CALLS")
+    llm_breaker_cooldown_seconds: float = Field(30.0, alias="LLM_BREAKER_COOLDOWN_SECONDS")
 
     langchain_api_key: str | None = Field(None, alias="LANGCHAIN_API_KEY")
     langsmith_api_key: str | None = Field(None, alias="LANGSMITH_API_KEY")
     langsmith_project: str | None = Field(None, alias="LANGSMITH_PROJECT")
 
+    core_service_url: str | None = Field("http://localhost:3002/api/v1", alias="CORE_SERVICE_URL")
+    job_snapshot_ttl_seconds: int = Field(300, alias="JOB_SNAPSHOT_TTL_SECONDS")
+    job_snapshot_full_refresh_seconds: int = Field(3600, alias="JOB_SNAPSHOT_FULL_REFRESH_SECONDS")
+    job_leads_top_k: int = Field(5, alias="JOB_LEADS_TOP_K")
+    roadmap_cache_max_age: int = Field(3600, alias="ROADMAP_CACHE_MAX_AGE")
+    compression_min_bytes: int = Field(1024, alias="COMPRESSION_MIN_BYTES")
+
+    # Readiness: background dependency probes; failures of critical ones mark the pod not ready.
+    # The LLM is not critical by default: a Gemini outage would otherwise pull every pod out of
+    # rotation at once, while requests still answer from the heuristic/template fallbacks. A
+    # non-critical LLM is not pinged at all.
+    readiness_probe_interval_seconds: float = Field(15.0, alias="READINESS_PROBE_INTERVAL_SECONDS")
+    readiness_llm_probe_interval_seconds: float = Field(60.0, alias="READINESS_LLM_PROBE_INTERVAL_SECONDS")
+    readiness_probe_timeout_seconds: float = Field(3.0, alias="READINESS_PROBE_TIMEOUT_SECONDS")
+    readiness_critical_dependencies: str = Field("redis,core_service", alias="READINESS_CRITICAL_DEPENDENCIES")
+
     mongo_uri: str | None = Field(None, alias="MONGO_URI")
     redis_url: str | None = Field(None, alias="REDIS_URL")
 
@@ -34,6 +74,29 @@ class Settings(BaseSettings):
     rate_limit_default: str = Field("60/minute", alias="RATE_LIMIT_DEFAULT")
     log_level: str = Field("INFO", alias="LOG_LEVEL")
 
+    # Admission scheduler: shared graph-run slots, per-class weights, caps and queue limits.
+    scheduler_capacity: int = Field(8, alias="SCHEDULER_CAPACITY")
+    interactive_weight: float = Field(8.0, alias="INTERACTIVE_WEIGHT")
+    interactive_max_queue: int = Field(200, alias="INTERACTIVE_MAX_QUEUE")
+    bulk_weight: float = Field(1.0, alias="BULK_WEIGHT")
+    bulk_max_concurrency: int = Field(2, alias="BULK_MAX_CONCURRENCY")
+    bulk_max_queue: int = Field(1000, alias="BULK_MAX_QUEUE")
+    # Comma-separated tenants (from TENANT_API_KEYS) whose requests always run as bulk traffic.
+    bulk_tenants: str = Field("", alias="BULK_TENANTS")
+
+    # Daily Gemini token budget per tenant, counted in Redis (REDIS_URL) across workers; unset
+    # means unlimited. Past the economy ratio only the lite model is used; once spent,
+    # heuristic/template fallbacks answer. Without Redis the counters are per worker process.
+    tenant_daily_token_budget: int | None = Field(None, alias="TENANT_DAILY_TOKEN_BUDGET")
+    tenant_economy_ratio: float = Field(0.8, alias="TENANT_ECONOMY_RATIO")
+    # Comma-separated "tenant:key" pairs; callers identify with X-Tenant-Key, others are DEFAULT_TENANT.
+    tenant_api_keys: str = Field("", alias="TENANT_API_KEYS")
+    default_tenant: str = Field("public", alias="DEFAULT_TENANT")
+
+    admin_token: str | None = Field(None, alias="ADMIN_TOKEN")
+    profile_dir: str = Field("/tmp/jobsupi-profiles", alias="PROFILE_DIR")
+    slow_request_buffer_size: int = Field(200, alias="SLOW_REQUEST_BUFFER_SIZE")
+
     # Optional LangChain/LangSmith settings
     langchain_tracing_v2: str | None = Field(None, alias="LANGCHAIN_TRACING_V2")
     langchain_endpoint: str | None = Field(None, alias="LANGCHAIN_ENDPOINT")
@@ -0,0 +1,37 @@
+"""orjson-backed helpers for prompt payloads and endpoint responses."""
+
+from __future__ import annotations
+
+from typing import Any, Type
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def dumps(payload: Any) -> str:
+    """Serialize ``payload`` to compact JSON text (non-ASCII kept as-is, like ``ensure_ascii=False``)."""
+    return orjson.dumps(payload).decode("utf-8")
+
+
+def loads(text: str | bytes) -> Any:
+    """Parse JSON text produced by the LLM or an upstream service."""
+    return orjson.loads(text)
+
+
+def typed_response(model: Type[BaseModel], status_code: int = 200, **fields: Any) -> ORJSONResponse:
+    """Serialize graph output that is already shaped like ``model`` without validating it again.
+
+    Graph nodes build ``RoleRecommendation``/``RoadmapStep`` dicts with the right types, and LLM
+    output is validated where it is parsed (``nodes._parse_recommendations``), so running them back
+    through Pydantic (and then FastAPI's ``response_model`` pass) only burns CPU. Missing optional
+    fields are filled from the model defaults so the payload keeps the documented shape.
+    """
+
+    content: dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        if name in fields:
+            content[name] = fields[name]
+        elif not field.is_required():
+            content[name] = field.get_default(call_default_factory=True)
+    return ORJSONResponse(content=content, status_code=status_code)
@@ -6,30 +6,55 @@ from functools import lru_cache
 
 from langgraph.graph import END, StateGraph
 
+from app.config import get_settings
 from app.graph.nodes import (
     collect_profile_node,
+    job_matching_node,
+    reconcile_speculation_node,
     roadmap_builder_node,
     role_scoring_node,
+    speculative_plan_node,
     summary_node,
 )
 from app.graph.state import SeekerGraphState
+from app.services.profiling import timed_node
 
 
-@lru_cache
-def build_seeker_graph():
-    """Compile and cache the seeker guidance LangGraph."""
+def build_seeker_graph(speculative: bool | None = None):
+    """Compile and cache the seeker guidance LangGraph.
+
+    In speculative mode (``SPECULATIVE_PIPELINE``) the roadmap and summary for the heuristic top
+    role are prepared in parallel with LLM ranking, and kept when ranking picks the same role.
+    """
+
+    if speculative is None:
+        speculative = get_settings().speculative_pipeline
+    return _compile_seeker_graph(speculative)
 
-    graph = StateGraph(SeekerGraphState)
-    graph.add_node("collect_profile", collect_profile_node)
-    graph.add_node("role_scoring", role_scoring_node)
-    graph.add_node("roadmap_builder", roadmap_builder_node)
-    graph.add_node("generate_summary", summary_node)
 
+@lru_cache
+def _compile_seeker_graph(speculative: bool):
+    graph = StateGraph(SeekerGraphState)
+    graph.add_node("collect_profile", timed_node("collect_profile", collect_profile_node))
+    graph.add_node("role_scoring", timed_node("role_scoring", role_scoring_node))
+    graph.add_node("job_matching", timed_node("job_matching", job_matching_node))
     graph.set_entry_point("collect_profile")
-    graph.add_edge("collect_profile", "role_scoring")
-    graph.add_edge("role_scoring", "roadmap_builder")
-    graph.add_edge("roadmap_builder", "generate_summary")
-    graph.add_edge("generate_summary", END)
+
+    if speculative:
+        graph.add_node("speculative_plan", timed_node("speculative_plan", speculative_plan_node))
+        graph.add_node("reconcile_speculation", timed_node("reconcile_speculation", reconcile_speculation_node))
+        graph.add_edge("collect_profile", "role_scoring")
+        graph.add_edge("collect_profile", "speculative_plan")
+        graph.add_edge(["role_scoring", "speculative_plan"], "reconcile_speculation")
+        graph.add_edge("reconcile_speculation", "job_matching")
+    else:
+        graph.add_node("roadmap_builder", timed_node("roadmap_builder", roadmap_builder_node))
+        graph.add_node("generate_summary", timed_node("generate_summary", summary_node))
+        graph.add_edge("collect_profile", "role_scoring")
+        graph.add_edge("role_scoring", "roadmap_builder")
+        graph.add_edge("roadmap_builder", "generate_summary")
+        graph.add_edge("generate_summary", "job_matching")
+    graph.add_edge("job_matching", END)
 
     compiled_graph = graph.compile()
     return compiled_graph
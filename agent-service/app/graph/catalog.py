@@ -0,0 +1,107 @@
+"""Role catalog shared by the graph nodes, the roadmap planner and catalog endpoints.
+
+Roadmap steps carry planner metadata: ``step_id``, the skills each step ``teaches`` and the
+``depends_on`` step IDs that must come first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Dict, List, Optional
+
+import orjson
+
+# Placeholder catalog data until the core-service API is wired in.
+ROLE_LIBRARY: List[Dict] = [
+    {
+        "role_id": "mern-support-intern",
+        "title": "MERN Support Intern",
+        "skills": {"must_have": {"javascript": 1, "html": 1}, "nice_to_have": {"mongodb": 1}},
+        "personality": ["detail-oriented", "curious"],
+        "environment": {"mobility": "low"},
+        "roadmap": [
+            {
+                "step_id": "frontend-refresh",
+                "title": "Frontend refresh",
+                "description": "Revisit React + Tailwind basics to support UI fixes in the MERN stack portal.",
+                "duration_weeks": 2,
+                "resources": ["JobsUPI React snippets", "Vite/Tailwind crash course"],
+                "teaches": ["javascript", "html", "react", "tailwind"],
+                "depends_on": [],
+            },
+            {
+                "step_id": "api-ticket-drills",
+                "title": "API ticket drills",
+                "description": "Shadow senior devs to triage Express/Mongo API bugs and log AI-agent issues.",
+                "duration_weeks": 2,
+                "resources": ["Postman collections", "GitHub issue templates"],
+                "teaches": ["express", "mongodb", "api-debugging"],
+                "depends_on": ["frontend-refresh"],
+            },
+        ],
+    },
+    {
+        "role_id": "ai-data-ops-associate",
+        "title": "AI Data Ops Associate",
+        "skills": {"must_have": {"excel": 1, "python": 1}, "nice_to_have": {"langchain": 1}},
+        "personality": ["analytical", "process-driven"],
+        "environment": {"mobility": "medium"},
+        "roadmap": [
+            {
+                "step_id": "labeling-playbook",
+                "title": "Labeling playbook",
+                "description": "Learn annotation SOPs for Gemini/LangGraph training data.",
+                "duration_weeks": 2,
+                "resources": ["Label Studio basics", "QA checklist"],
+                "teaches": ["data-annotation", "quality-checks"],
+                "depends_on": [],
+            },
+            {
+                "step_id": "ops-automations",
+                "title": "Ops automations",
+                "description": "Practice writing Python notebooks that push clean data into Mongo/Redis caches.",
+                "duration_weeks": 3,
+                "resources": ["FastAPI ops guide", "LangChain tooling demos"],
+                "teaches": ["python", "langchain", "fastapi"],
+                "depends_on": ["labeling-playbook"],
+            },
+        ],
+    },
+    {
+        "role_id": "edge-ai-field-tech",
+        "title": "Edge AI Field Technician",
+        "skills": {"must_have": {"networking": 1}, "nice_to_have": {"iot": 1}},
+        "personality": ["hands-on", "problem-solver"],
+        "environment": {"mobility": "high"},
+        "roadmap": [
+            {
+                "step_id": "device-commissioning",
+                "title": "Device commissioning",
+                "description": "Shadow senior techs to deploy IoT sensors that sync with MERN dashboards.",
+                "duration_weeks": 3,
+                "resources": ["Hardware checklists", "Edge deployment SOP"],
+                "teaches": ["networking", "iot"],
+                "depends_on": [],
+            },
+            {
+                "step_id": "ai-health-checks",
+                "title": "AI health checks",
+                "description": "Use LangSmith traces and FastAPI probes to validate on-site models.",
+                "duration_weeks": 2,
+                "resources": ["LangGraph observability guide"],
+                "teaches": ["langsmith", "fastapi"],
+                "depends_on": ["device-commissioning"],
+            },
+        ],
+    },
+]
+
+_ROLES_BY_ID: Dict[str, Dict] = {role["role_id"]: role for role in ROLE_LIBRARY}
+
+# Content hash of the catalog; changes whenever any role or roadmap step changes.
+CATALOG_VERSION = hashlib.sha256(orjson.dumps(ROLE_LIBRARY, option=orjson.OPT_SORT_KEYS)).hexdigest()[:16]
+
+
+def get_role(role_id: Optional[str]) -> Optional[Dict]:
+    """Return the catalog entry for ``role_id`` or None when unknown."""
+    return _ROLES_BY_ID.get(role_id) if role_id else None
@@ -1,88 +1,28 @@
-"""LangGraph node implementations with inline error handling and logging."""
+"""LangGraph node implementations with inline error handling and logging.
+
+Nodes return only the keys they change; LangGraph merges them into the state, appending to the
+``errors`` channel through its reducer instead of copying the whole state at each step.
+"""
 
 from __future__ import annotations
 
-import json
-from typing import Dict, List
+import time
+from typing import Dict, List, Tuple
 
 from langchain_core.messages import AIMessage
 from langsmith import traceable
 
 from loguru import logger
 
-from app.graph.state import RoadmapStep, RoleRecommendation, SeekerGraphState
-from app.services.llm import get_llm
-
-# Placeholder catalog data until the core-service API is wired in.
-ROLE_LIBRARY: List[Dict] = [
-    {
-        "role_id": "mern-support-intern",
-        "title": "MERN Support Intern",
-        "skills": {"must_have": {"javascript": 1, "html": 1}, "nice_to_have": {"mongodb": 1}},
-        "personality": ["detail-oriented", "curious"],
-        "environment": {"mobility": "low"},
-        "roadmap": [
-            {
-                "title": "Frontend refresh",
-                "description": "Revisit React + Tailwind basics to support UI fixes in the MERN stack portal.",
-                "duration_weeks": 2,
-                "resources": ["JobsUPI React snippets", "Vite/Tailwind crash course"],
-            },
-            {
-                "title": "API ticket drills",
-                "description": "Shadow senior devs to triage Express/Mongo API bugs and log AI-agent issues.",
-                "duration_weeks": 2,
-                "resources": ["Postman collections", "GitHub issue templates"],
-            },
-        ],
-    },
-    {
-        "role_id": "ai-data-ops-associate",
-        "title": "AI Data Ops Associate",
-        "skills": {"must_have": {"excel": 1, "python": 1}, "nice_to_have": {"langchain": 1}},
-        "personality": ["analytical", "process-driven"],
-        "environment": {"mobility": "medium"},
-        "roadmap": [
-            {
-                "title": "Labeling playbook",
-                "description": "Learn annotation SOPs for Gemini/LangGraph training data.",
-                "duration_weeks": 2,
-                "resources": ["Label Studio basics", "QA checklist"],
-            },
-            {
-                "title": "Ops automations",
-                "description": "Practice writing Python notebooks that push clean data into Mongo/Redis caches.",
-                "duration_weeks": 3,
-                "resources": ["FastAPI ops guide", "LangChain tooling demos"],
-            },
-        ],
-    },
-    {
-        "role_id": "edge-ai-field-tech",
-        "title": "Edge AI Field Technician",
-        "skills": {"must_have": {"networking": 1}, "nice_to_have": {"iot": 1}},
-        "personality": ["hands-on", "problem-solver"],
-        "environment": {"mobility": "high"},
-        "roadmap": [
-            {
-                "title": "Device commissioning",
-                "description": "Shadow senior techs to deploy IoT sensors that sync with MERN dashboards.",
-                "duration_weeks": 3,
-                "resources": ["Hardware checklists", "Edge deployment SOP"],
-            },
-            {
-                "title": "AI health checks",
-                "description": "Use LangSmith traces and FastAPI probes to validate on-site models.",
-                "duration_weeks": 2,
-                "resources": ["LangGraph observability guide"],
-            },
-        ],
-    },
-]
-
-
-def _append_error(state: SeekerGraphState, message: str) -> None:
-    state.setdefault("errors", []).append(message)
+from app.core.serialization import dumps, loads
+from app.config import get_settings
+from app.graph.catalog import ROLE_LIBRARY, get_role
+from app.graph.roadmap_planner import plan_roadmap
+from app.graph.state import JobLead, RoadmapStep, RoleRecommendation, SeekerGraphState, SpeculativePlan
+from app.services.job_index import get_job_index
+from app.services.llm import CircuitOpenError, get_llm, get_llm_breaker
+from app.services.model_router import get_model_router
+from app.services.usage import ECONOMY, EXHAUSTED, capture_usage, get_tenant, get_usage_ledger, usage_from_message
 
 
 def _extract_text(message: AIMessage) -> str:
@@ -105,9 +45,44 @@ def _role_catalog_snapshot(limit: int = 5) -> List[Dict]:
     ]
 
 
+def _invoke_routed(node: str, prompt: str, latency_budget_ms: float | None = None) -> AIMessage:
+    """Invoke the node's model chain in order, falling back to the next model on failure.
+
+    Token usage of the successful call is charged to the current tenant; tenants near their daily
+    budget are routed to the economy model.
+    """
+
+    router = get_model_router()
+    ledger = get_usage_ledger()
+    tenant = get_tenant()
+    last_exc: Exception | None = None
+    for route in router.chain(node, latency_budget_ms, economy=ledger.tier(tenant) == ECONOMY):
+        llm = get_llm(**route.llm_kwargs())
+        started = time.perf_counter()
+        try:
+            message = llm.invoke(prompt)
+        except Exception as exc:
+            router.record(route, (time.perf_counter() - started) * 1000, ok=False)
+            logger.warning("Model route {} failed: {!r}", route.key, exc)
+            last_exc = exc
+            continue
+        router.record(route, (time.perf_counter() - started) * 1000, ok=True)
+        ledger.record(tenant, usage_from_message(node, route.model_name, prompt, message))
+        return message
+    raise last_exc or RuntimeError(f"No model routes configured for {node}")
+
+
+def _is_ambiguous(heuristic: List[RoleRecommendation]) -> bool:
+    if len(heuristic) < 2:
+        return False
+    # Scores are rounded to 2 decimals; round the gap too so one score step compares the same
+    # everywhere (0.7 - 0.6 is 0.0999... in floating point, 0.4 - 0.3 is 0.1000...).
+    margin = round(heuristic[0]["match_score"] - heuristic[1]["match_score"], 2)
+    return margin < get_settings().ranking_ambiguity_margin
+
+
 @traceable(name="recommend_roles")
-def _call_llm_for_recommendations(profile: dict) -> List[RoleRecommendation]:
-    llm = get_llm()
+def _call_llm_for_recommendations(profile: dict, ambiguous: bool = False) -> List[RoleRecommendation]:
     prompt = (
         "You are a job mentor for blue/grey collar workers in India.\n"
         "Given the candidate profile and a role catalog, rank the best 3 roles.\n"
@@ -119,44 +94,105 @@ def _call_llm_for_recommendations(profile: dict) -> List[RoleRecommendation]:
         "profile": profile,
         "catalog": _role_catalog_snapshot(),
     }
-    message = llm.invoke(f"{prompt}\nData:\n{json.dumps(payload, ensure_ascii=False)}")
+    # Only the API round-trip counts toward the breaker; unusable replies are handled by the caller.
+    message = get_llm_breaker().call(
+        _invoke_routed,
+        "ranking_ambiguous" if ambiguous else "ranking",
+        f"{prompt}\nData:\n{dumps(payload)}",
+        get_settings().ranking_latency_budget_ms,
+    )
     text = _extract_text(message).strip()
     logger.info("Raw Gemini recommendation output: {}", text)
+    return _parse_recommendations(text)
+
+
+def _parse_recommendations(text: str) -> List[RoleRecommendation]:
+    """Extract the JSON array from a ranking reply, keeping only well-formed catalog roles.
+
+    Items go straight into API responses without another Pydantic pass, so ``role_id``/``title``
+    must be strings, ``role_id`` must exist in the catalog and ``match_score`` is clamped to 0..1.
+    Raises ``ValueError`` when no usable item remains.
+    """
+
     start = text.find("[")
     end = text.rfind("]") + 1
     if start == -1 or end == 0:
         raise ValueError("LLM response missing JSON array")
-    data = json.loads(text[start:end])
+    data = loads(text[start:end])
+    if not isinstance(data, list):
+        raise ValueError("LLM response is not a JSON array")
     recommendations: List[RoleRecommendation] = []
+    seen = set()
     for item in data:
+        if not isinstance(item, dict):
+            continue
+        role_id, title = item.get("role_id"), item.get("title")
+        if not isinstance(role_id, str) or not isinstance(title, str) or role_id in seen or get_role(role_id) is None:
+            logger.warning("Dropping invalid LLM recommendation: {}", item)
+            continue
+        try:
+            match_score = min(max(float(item.get("match_score")), 0.0), 1.0)
+        except (TypeError, ValueError):
+            logger.warning("Dropping LLM recommendation with bad match_score: {}", item)
+            continue
+        rationale = item.get("rationale")
+        seen.add(role_id)
         recommendations.append(
             RoleRecommendation(
-                role_id=item["role_id"],
-                title=item["title"],
-                match_score=float(item["match_score"]),
-                rationale=item.get("rationale", "LLM generated rationale"),
+                role_id=role_id,
+                title=title,
+                match_score=match_score,
+                rationale=rationale if isinstance(rationale, str) else "LLM generated rationale",
             )
         )
+    if not recommendations:
+        raise ValueError("LLM response has no valid catalog roles")
     return recommendations
 
 
 @traceable(name="summarize_recommendation")
-def _call_llm_for_summary(role: RoleRecommendation, roadmap: List[RoadmapStep]) -> str:
-    llm = get_llm()
+def _call_llm_for_summary(role: RoleRecommendation, roadmap: List[RoadmapStep], with_fit: bool = True) -> str:
+    """Summarize ``role`` and ``roadmap``; ``with_fit=False`` leaves out the ranking score/rationale.
+
+    Speculative summaries are written before ranking finishes, so they only use what ranking can't
+    change for the chosen role: its id, catalog title and planned roadmap.
+    """
+
     prompt = (
         "Summarize the recommended role and roadmap for an Indian job seeker in one concise paragraph.\n"
         "Highlight why the role fits and how long the roadmap takes.\n"
         "Return plain text response."
     )
     payload = {
-        "role": role,
+        "role": role if with_fit else {"role_id": role["role_id"], "title": role["title"]},
         "roadmap": roadmap,
     }
-    message = llm.invoke(f"{prompt}\nData:\n{json.dumps(payload, ensure_ascii=False)}")
-    return _extract_text(message).strip()
+    message = get_llm_breaker().call(
+        _invoke_routed,
+        "summary",
+        f"{prompt}\nData:\n{dumps(payload)}",
+        get_settings().summary_latency_budget_ms,
+    )
+    summary = _extract_text(message).strip()
+    if not summary:
+        raise ValueError("LLM returned an empty summary")
+    return summary
+
+
+def _budget_exhausted() -> bool:
+    return get_usage_ledger().tier(get_tenant()) == EXHAUSTED
+
+
+def _template_summary(role: RoleRecommendation, roadmap: List[RoadmapStep]) -> str:
+    return (
+        f"Recommended role: {role['title']} (match score {role['match_score']}). "
+        f"Estimated roadmap length: {sum(step.get('duration_weeks', 0) for step in roadmap)} weeks."
+    )
 
 
-def _heuristic_recommendations(normalized: dict) -> List[RoleRecommendation]:
+def heuristic_recommendations(normalized: dict) -> List[RoleRecommendation]:
+    """Score every catalog role by skill/personality overlap and mobility fit; return the top 3."""
+
     skills = set(normalized.get("skills", []))
     personality = set(normalized.get("personality", []))
     preferred_mobility = normalized.get("preferred_mobility", "medium")
@@ -186,27 +222,71 @@ def _heuristic_recommendations(normalized: dict) -> List[RoleRecommendation]:
     return recommendations[:3]
 
 
+def normalize_profile(profile: dict) -> dict:
+    """Lower-case and de-duplicate free-text answers and fill defaults."""
+    return {
+        "skills": sorted(set(map(str.lower, profile.get("skills", [])))),
+        "interests": sorted(set(map(str.lower, profile.get("interests", [])))),
+        "personality": sorted(set(map(str.lower, profile.get("personality", [])))),
+        "constraints": profile.get("constraints", {}),
+        "experience_years": profile.get("experience_years", 0),
+        "preferred_mobility": profile.get("preferred_mobility", "medium"),
+    }
+
+
+def rank_roles(normalized: dict) -> Tuple[List[RoleRecommendation], List[str]]:
+    """Rank roles with Gemini behind the circuit breaker, falling back to the heuristic ranking."""
+
+    heuristic = heuristic_recommendations(normalized)
+    if _budget_exhausted():
+        return heuristic, ["Daily Gemini token budget used up; heuristic used"]
+    try:
+        recommendations = _call_llm_for_recommendations(normalized, ambiguous=_is_ambiguous(heuristic))
+    except CircuitOpenError:
+        return heuristic, ["Gemini unavailable (circuit open); heuristic used"]
+    except ValueError as exc:
+        logger.warning("Gemini ranking reply unusable: {!r}", exc)
+        return heuristic, ["Gemini ranking reply unusable; fallback heuristic used"]
+    except Exception as exc:
+        logger.warning("Gemini role scoring failed: {!r}", exc)
+        return heuristic, ["Gemini scoring failed; fallback heuristic used"]
+    return recommendations, []
+
+
+def summarize_recommendation(
+    role: RoleRecommendation, roadmap: List[RoadmapStep], with_fit: bool = True
+) -> Tuple[str, List[str]]:
+    """Summarize with Gemini behind the circuit breaker, falling back to a template summary."""
+
+    if _budget_exhausted():
+        return _template_summary(role, roadmap), ["Daily Gemini token budget used up; template summary used"]
+    try:
+        summary = _call_llm_for_summary(role, roadmap, with_fit)
+    except CircuitOpenError:
+        return _template_summary(role, roadmap), ["Gemini unavailable (circuit open); template summary used"]
+    except ValueError as exc:
+        logger.warning("Gemini summary reply unusable: {!r}", exc)
+        return _template_summary(role, roadmap), ["Gemini summary reply unusable; fallback used"]
+    except Exception as exc:
+        logger.warning("Gemini summary generation failed: {!r}", exc)
+        return _template_summary(role, roadmap), ["Gemini summary failed; fallback used"]
+    return summary, []
+
+
 def collect_profile_node(state: SeekerGraphState) -> SeekerGraphState:
     """Normalize user-provided profile answers into structured attributes."""
 
+    errors: List[str] = []
     try:
         profile = state.get("seeker_profile") or {}
         if not profile:
-            _append_error(state, "Profile inputs missing; defaults applied")
-        normalized_profile = {
-            "skills": sorted(set(map(str.lower, profile.get("skills", [])))),
-            "interests": sorted(set(map(str.lower, profile.get("interests", [])))),
-            "personality": sorted(set(map(str.lower, profile.get("personality", [])))),
-            "constraints": profile.get("constraints", {}),
-            "experience_years": profile.get("experience_years", 0),
-            "preferred_mobility": profile.get("preferred_mobility", "medium"),
-        }
+            errors.append("Profile inputs missing; defaults applied")
+        normalized_profile = normalize_profile(profile)
         logger.debug("Normalized profile: {}", normalized_profile)
-        return {**state, "normalized_profile": normalized_profile}
+        return {"normalized_profile": normalized_profile, "errors": errors}
     except Exception as exc:  # pragma: no cover - defensive path
         logger.exception("Profile normalization failed: {}", exc)
-        _append_error(state, "Unable to parse seeker profile")
-        return state
+        return {"errors": [*errors, "Unable to parse seeker profile"]}
 
 
 def role_scoring_node(state: SeekerGraphState) -> SeekerGraphState:
@@ -214,63 +294,125 @@ def role_scoring_node(state: SeekerGraphState) -> SeekerGraphState:
 
     normalized = state.get("normalized_profile")
     if not normalized:
-        _append_error(state, "Profile data missing; cannot score roles")
-        return state
-
-    try:
-        recommendations = _call_llm_for_recommendations(normalized)
-    except Exception as exc:
-        logger.exception("Gemini role scoring failed: {}", exc)
-        _append_error(state, "Gemini scoring failed; fallback heuristic used")
-        recommendations = _heuristic_recommendations(normalized)
+        return {"errors": ["Profile data missing; cannot score roles"]}
 
+    with capture_usage() as usage:
+        recommendations, errors = rank_roles(normalized)
     selected_role_id = recommendations[0]["role_id"] if recommendations else None
     return {
-        **state,
         "role_candidates": recommendations,
         "selected_role_id": selected_role_id,
+        "errors": errors,
+        "llm_usage": usage,
     }
 
 
 def roadmap_builder_node(state: SeekerGraphState) -> SeekerGraphState:
-    """Construct a lightweight roadmap for the top-ranked role."""
+    """Plan the top-ranked role's roadmap, skipping steps the seeker's skills already cover."""
 
     selected_role_id = state.get("selected_role_id")
     if not selected_role_id:
-        _append_error(state, "No role selected; roadmap generation skipped")
-        return state
+        return {"errors": ["No role selected; roadmap generation skipped"]}
 
-    role = next((r for r in ROLE_LIBRARY if r["role_id"] == selected_role_id), None)
+    role = get_role(selected_role_id)
     if not role:
-        _append_error(state, "Selected role not found in library")
-        return state
+        return {"errors": ["Selected role not found in library"]}
 
-    roadmap_steps: List[RoadmapStep] = role.get("roadmap", [])
+    skills = (state.get("normalized_profile") or {}).get("skills", [])
+    roadmap_steps: List[RoadmapStep] = plan_roadmap(selected_role_id, skills)
     logger.debug("Roadmap for {}: {}", selected_role_id, roadmap_steps)
 
-    return {
-        **state,
-        "roadmap": roadmap_steps,
-    }
+    return {"roadmap": roadmap_steps}
+
+
+def _ranked_role(state: SeekerGraphState) -> RoleRecommendation | None:
+    selected_role_id = state.get("selected_role_id")
+    return next((r for r in (state.get("role_candidates") or []) if r["role_id"] == selected_role_id), None)
 
 
 def summary_node(state: SeekerGraphState) -> SeekerGraphState:
     """Produce a concise textual summary for downstream channels/UI."""
 
-    role = next((r for r in (state.get("role_candidates") or []) if r["role_id"] == state.get("selected_role_id")), None)
+    role = _ranked_role(state)
     if not role:
-        _append_error(state, "Unable to build summary; missing role context")
-        return state
+        return {"errors": ["Unable to build summary; missing role context"]}
 
-    roadmap = state.get("roadmap", [])
-    try:
-        summary = _call_llm_for_summary(role, roadmap)
-    except Exception as exc:
-        logger.exception("Gemini summary generation failed: {}", exc)
-        _append_error(state, "Gemini summary failed; fallback used")
-        summary = (
-            f"Recommended role: {role['title']} (match score {role['match_score']}). "
-            f"Estimated roadmap length: {sum(step.get('duration_weeks', 0) for step in roadmap)} weeks."
-        )
+    with capture_usage() as usage:
+        summary, errors = summarize_recommendation(role, state.get("roadmap", []))
     logger.debug("Summary generated: {}", summary)
-    return {**state, "summary": summary}
+    return {"summary": summary, "errors": errors, "llm_usage": usage}
+
+
+def speculative_plan_node(state: SeekerGraphState) -> SeekerGraphState:
+    """Plan and summarize the heuristic top role in parallel with LLM ranking.
+
+    Skipped when the heuristic's top two roles are close, since the LLM is then likely to pick a
+    different one and the summary call would be wasted.
+    """
+
+    normalized = state.get("normalized_profile")
+    if not normalized:
+        return {"speculation": None}
+    heuristic = heuristic_recommendations(normalized)
+    if not heuristic or _is_ambiguous(heuristic):
+        return {"speculation": None}
+
+    role = heuristic[0]
+    roadmap = plan_roadmap(role["role_id"], normalized.get("skills", []))
+    with capture_usage() as usage:
+        summary, errors = summarize_recommendation(role, roadmap, with_fit=False)
+    speculation = SpeculativePlan(role_id=role["role_id"], roadmap=roadmap, summary=summary, errors=errors)
+    return {"speculation": speculation, "llm_usage": usage}
+
+
+def speculation_matches_ranking(state: SeekerGraphState) -> bool:
+    """True when ranking chose the role the speculative plan was built for."""
+
+    speculation = state.get("speculation")
+    return bool(speculation) and speculation["role_id"] == state.get("selected_role_id")
+
+
+def reconcile_speculation_node(state: SeekerGraphState) -> SeekerGraphState:
+    """Keep the speculative roadmap/summary if ranking chose the same role, else build them now.
+
+    The speculative summary doesn't mention the ranking score or rationale, so it holds for the
+    ranked role as is. A template fallback does quote the heuristic score and is rebuilt from the
+    ranked role, which costs no LLM call.
+    """
+
+    speculation = state.get("speculation")
+    if speculation_matches_ranking(state):
+        logger.debug("Speculative plan for {} kept", speculation["role_id"])
+        summary = speculation["summary"]
+        ranked = _ranked_role(state)
+        if speculation["errors"] and ranked:
+            summary = _template_summary(ranked, speculation["roadmap"])
+        return {"roadmap": speculation["roadmap"], "summary": summary, "errors": speculation["errors"]}
+
+    if speculation:
+        logger.debug(
+            "Speculative plan for {} discarded; ranking chose {}", speculation["role_id"], state.get("selected_role_id")
+        )
+    planned = roadmap_builder_node(state)
+    summarized = summary_node({**state, **planned})
+    return {**planned, **summarized, "errors": planned.get("errors", []) + summarized.get("errors", [])}
+
+
+def job_matching_node(state: SeekerGraphState) -> SeekerGraphState:
+    """Attach open job leads for the selected role that fit the seeker's constraints."""
+
+    selected_role_id = state.get("selected_role_id")
+    if not get_role(selected_role_id):
+        return {"job_leads": []}
+
+    constraints = (state.get("normalized_profile") or {}).get("constraints") or {}
+    index = get_job_index()
+    index.refresh_if_stale()
+    job_leads: List[JobLead] = index.top_k(
+        selected_role_id,
+        location=constraints.get("location"),
+        salary_expectation=constraints.get("salary_expectation"),
+        k=get_settings().job_leads_top_k,
+    )
+    logger.debug("Matched {} job leads for {}", len(job_leads), selected_role_id)
+    return {"job_leads": job_leads}
@@ -0,0 +1,104 @@
+"""Deterministic skill-gap roadmap planning over the catalog's step dependency DAG."""
+
+from __future__ import annotations
+
+import heapq
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+from app.graph.catalog import get_role
+from app.graph.state import RoadmapStep
+
+
+def _public_step(step: Dict) -> RoadmapStep:
+    return RoadmapStep(
+        title=step["title"],
+        description=step["description"],
+        duration_weeks=step.get("duration_weeks", 0),
+        resources=list(step.get("resources", [])),
+    )
+
+
+def _topological_order(indegree: Dict[str, int], dependents: Dict[str, List[str]]) -> List[str]:
+    pending = dict(indegree)
+    queue = [step_id for step_id, degree in pending.items() if degree == 0]
+    for step_id in queue:
+        for child in dependents[step_id]:
+            pending[child] -= 1
+            if pending[child] == 0:
+                queue.append(child)
+    return queue
+
+
+def _critical_path_weeks(
+    steps: Dict[str, Dict], dependents: Dict[str, List[str]], topo_order: List[str]
+) -> Dict[str, int]:
+    """Longest duration-weighted path from each step to the end of the roadmap (inclusive)."""
+
+    weeks: Dict[str, int] = {}
+    for step_id in reversed(topo_order):
+        tail = max((weeks[child] for child in dependents[step_id]), default=0)
+        weeks[step_id] = steps[step_id].get("duration_weeks", 0) + tail
+    return weeks
+
+
+@lru_cache(maxsize=None)
+def _taught_skills(role_id: str) -> FrozenSet[str]:
+    role = get_role(role_id) or {}
+    return frozenset(skill for step in role.get("roadmap", []) for skill in step.get("teaches", []))
+
+
+@lru_cache(maxsize=4096)
+def _plan(role_id: str, known_skills: FrozenSet[str]) -> Tuple[RoadmapStep, ...]:
+    role = get_role(role_id)
+    if role is None:
+        raise KeyError(role_id)
+    catalog_steps = role.get("roadmap", [])
+    order = {step["step_id"]: position for position, step in enumerate(catalog_steps)}
+
+    # Drop steps whose skills the seeker already has; their dependents treat them as satisfied.
+    remaining = {
+        step["step_id"]: step
+        for step in catalog_steps
+        if not step.get("teaches") or not set(step["teaches"]) <= known_skills
+    }
+    dependents: Dict[str, List[str]] = {step_id: [] for step_id in remaining}
+    indegree: Dict[str, int] = {step_id: 0 for step_id in remaining}
+    for step_id, step in remaining.items():
+        for parent in step.get("depends_on", []):
+            if parent in remaining:
+                dependents[parent].append(step_id)
+                indegree[step_id] += 1
+
+    topo_order = _topological_order(indegree, dependents)
+    if len(topo_order) != len(remaining):
+        raise ValueError(f"Roadmap for {role_id} has a dependency cycle")
+    critical = _critical_path_weeks(remaining, dependents, topo_order)
+
+    # Kahn's algorithm; among ready steps start the one on the longest remaining path first.
+    ready = [(-critical[step_id], order[step_id], step_id) for step_id, degree in indegree.items() if degree == 0]
+    heapq.heapify(ready)
+    planned: List[RoadmapStep] = []
+    while ready:
+        _, _, step_id = heapq.heappop(ready)
+        planned.append(_public_step(remaining[step_id]))
+        for child in dependents[step_id]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                heapq.heappush(ready, (-critical[child], order[child], child))
+
+    return tuple(planned)
+
+
+def plan_roadmap(role_id: str, skills: Iterable[str]) -> List[RoadmapStep]:
+    """Return the ordered steps of ``role_id``'s roadmap that the seeker still needs.
+
+    Results are memoized per (role, relevant skills); only skills some step teaches are part of
+    the key, so unrelated skills don't fragment the cache. Callers get their own copies of the
+    steps, so mutating one can't leak into later requests.
+    """
+
+    if get_role(role_id) is None:
+        raise KeyError(role_id)
+    planned = _plan(role_id, _taught_skills(role_id).intersection(skills))
+    return [RoadmapStep({**step, "resources": list(step["resources"])}) for step in planned]
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, TypedDict
+import operator
+from typing import Annotated, List, Optional, TypedDict
 
 
 class RoleRecommendation(TypedDict):
@@ -23,6 +24,40 @@ class RoadmapStep(TypedDict, total=False):
     resources: List[str]
 
 
+class JobLead(TypedDict):
+    """Represents an open job posting matched to the selected role."""
+
+    job_id: str
+    role_id: str
+    employer: str
+    location: str
+    salary_min: int
+    salary_max: int
+    shift: Optional[str]
+    status: str
+
+
+class LlmUsage(TypedDict):
+    """Token usage and estimated cost of one Gemini call."""
+
+    node: str
+    model: str
+    input_tokens: int
+    output_tokens: int
+    total_tokens: int
+    cost_usd: float
+    estimated: bool
+
+
+class SpeculativePlan(TypedDict):
+    """Roadmap and summary prepared for the heuristic top role while LLM ranking runs."""
+
+    role_id: str
+    roadmap: List[RoadmapStep]
+    summary: str
+    errors: List[str]
+
+
 class SeekerGraphState(TypedDict, total=False):
     """Top-level state passed between LangGraph nodes."""
 
@@ -32,5 +67,9 @@ class SeekerGraphState(TypedDict, total=False):
     selected_role_id: Optional[str]
     roadmap: List[RoadmapStep]
     summary: str
-    conversation_history: List[str]
-    errors: List[str]
+    job_leads: List[JobLead]
+    speculation: Optional[SpeculativePlan]
+    # Append reducers: nodes return only new entries and parallel branches merge safely.
+    conversation_history: Annotated[List[str], operator.add]
+    errors: Annotated[List[str], operator.add]
+    llm_usage: Annotated[List[LlmUsage], operator.add]
@@ -1,15 +1,22 @@
 """Application entrypoint for the JobsUPI Agent Service."""
 
+import gc
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
 from app.config import get_settings
 from app.core.exceptions import register_exception_handlers
+from app.middleware.profiling import ProfilingMiddleware
 from app.middleware.rate_limit import init_rate_limiter, limiter
 from app.middleware.request_context import RequestContextMiddleware
 from app.routers import api_router
 from app.routers import agents as agents_router
+from app.graph import build_seeker_graph
+from app.services.dependency_probes import get_probe_monitor
+from app.services.job_index import get_job_index
 
 settings = get_settings()
 
@@ -18,6 +25,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -27,6 +35,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ProfilingMiddleware)
 app.add_middleware(RequestContextMiddleware, log_level=settings.log_level)
 
 init_rate_limiter(app)
@@ -38,6 +47,37 @@ app.include_router(api_router)
 app.include_router(agents_router.router)
 
 
+def preload_shared_state() -> None:
+    """Build the compiled graph and job index in the gunicorn master before workers fork.
+
+    Workers inherit these objects copy-on-write; ``gc.freeze`` moves them out of the collector's
+    reach so GC passes in the workers don't touch (and un-share) their pages. LLM and LangSmith
+    clients stay lazy because their gRPC channels and background threads do not survive a fork.
+    """
+    build_seeker_graph()
+    get_job_index().refresh()
+    gc.collect()
+    gc.freeze()
+    logger.info("Preloaded graph and {} job postings before fork", len(get_job_index()))
+
+
+@app.on_event("startup")
+async def warm_job_index() -> None:
+    """Start loading the job snapshot so early role-fit requests already have leads."""
+    get_job_index().refresh_if_stale()
+
+
+@app.on_event("startup")
+async def start_dependency_probes() -> None:
+    """Probe Gemini, Redis and core-service once, then keep probing in the background."""
+    await get_probe_monitor().start()
+
+
+@app.on_event("shutdown")
+async def stop_dependency_probes() -> None:
+    await get_probe_monitor().stop()
+
+
 @app.get("/", tags=["root"])
 @limiter.limit(settings.rate_limit_default)
 async def root(request: Request) -> dict[str, str]:
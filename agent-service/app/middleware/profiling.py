@@ -0,0 +1,83 @@
+"""Middleware that records per-node timings and runs the sampling profiler on demand."""
+
+import hmac
+import time
+from typing import Callable
+
+from fastapi import Request
+from loguru import logger
+from pyinstrument import Profiler
+from pyinstrument.renderers import SpeedscopeRenderer
+from pyinstrument.session import Session
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.config import get_settings
+from app.core.logging import get_request_id
+from app.services.profiling import (
+    RequestTiming,
+    get_profile_store,
+    get_slow_request_log,
+    start_node_timings,
+    start_profile_capture,
+)
+
+
+def is_admin_request(request: Request) -> bool:
+    """Return True when the request carries the configured ``X-Admin-Token``."""
+    admin_token = get_settings().admin_token
+    supplied = request.headers.get("X-Admin-Token")
+    return bool(admin_token and supplied and hmac.compare_digest(supplied, admin_token))
+
+
+def _profiling_requested(request: Request) -> bool:
+    flag = request.headers.get("X-Profile") or request.query_params.get("profile")
+    return flag in ("1", "true") and is_admin_request(request)
+
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    """Times every request's graph nodes and, for admin callers that ask, captures a flamegraph.
+
+    Profiling is opt-in per request via ``X-Profile: 1`` (or ``?profile=1``) plus a valid
+    ``X-Admin-Token``; the speedscope artifact is stored under the request's ``X-Request-ID``.
+    The event-loop side is sampled here and merged with the sessions ``call_profiled`` captured
+    in threadpool workers, so the graph run never has to move onto the loop to be profiled.
+    """
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        request_id = get_request_id() or request.headers.get("X-Request-ID", "-")
+        timings = start_node_timings()
+        profiler = Profiler(interval=0.001, async_mode="enabled") if _profiling_requested(request) else None
+        thread_sessions = start_profile_capture(profiler is not None)
+
+        started = time.perf_counter()
+        if profiler:
+            profiler.start()
+        try:
+            response = await call_next(request)
+        finally:
+            if profiler:
+                profiler.stop()
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        artifact = None
+        if profiler:
+            session = profiler.last_session
+            for thread_session in thread_sessions or []:
+                session = Session.combine(session, thread_session)
+            path = get_profile_store().save(request_id, SpeedscopeRenderer().render(session))
+            artifact = path.name
+            response.headers["X-Profile-Artifact"] = artifact
+            logger.bind(request_id=request_id).info("Profile for {} stored at {}", request.url.path, path)
+
+        if timings:
+            get_slow_request_log().record(
+                RequestTiming(
+                    request_id=request_id,
+                    method=request.method,
+                    path=request.url.path,
+                    duration_ms=duration_ms,
+                    nodes_ms=dict(timings),
+                    profile_artifact=artifact,
+                )
+            )
+        return response
@@ -8,10 +8,11 @@ from loguru import logger
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.core.logging import configure_logging, get_request_id, set_request_id
+from app.services.usage import resolve_tenant, set_tenant
 
 
 class RequestContextMiddleware(BaseHTTPMiddleware):
-    """Injects request IDs and ensures incoming calls are logged consistently."""
+    """Injects request IDs and the caller's tenant, and ensures incoming calls are logged consistently."""
 
     def __init__(self, app, log_level: str = "INFO"):
         super().__init__(app)
@@ -20,6 +21,7 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: Callable):
         request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
         set_request_id(request_id)
+        set_tenant(resolve_tenant(request.headers.get("X-Tenant-Key")))
         logger.bind(request_id=request_id).info(
             "Incoming request {} {}", request.method, request.url.path
         )
@@ -1,6 +1,8 @@
 from fastapi import APIRouter
 
+from .admin import router as admin_router
 from .health import router as health_router
 
 api_router = APIRouter()
 api_router.include_router(health_router, tags=["health"])
+api_router.include_router(admin_router)
@@ -0,0 +1,49 @@
+"""Admin-only diagnostics endpoints (slow request log, profiles, scheduler and LLM usage)."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse
+
+from app.middleware.profiling import is_admin_request
+from app.services.profiling import get_profile_store, get_slow_request_log
+from app.services.scheduler import get_scheduler
+from app.services.usage import get_usage_ledger
+
+
+def require_admin(request: Request) -> None:
+    """Reject callers without a valid ``X-Admin-Token``."""
+    if not is_admin_request(request):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/profiles/slowest", summary="Slowest recent graph requests")
+async def slowest_requests(limit: int = Query(10, ge=1, le=100)) -> List[Dict[str, Any]]:
+    """Return the slowest requests in the ring buffer with per-node timings (ms)."""
+    return get_slow_request_log().slowest(limit)
+
+
+@router.get("/profiles/{request_id}", summary="Download a speedscope profile")
+async def download_profile(request_id: str) -> FileResponse:
+    """Return the speedscope JSON captured for ``request_id`` (open it at speedscope.app)."""
+    path = get_profile_store().path_for(request_id)
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="application/json", filename=path.name)
+
+
+@router.get("/scheduler", summary="Admission scheduler metrics")
+async def scheduler_stats() -> Dict[str, Any]:
+    """Return per-class concurrency, queue depth and queue-time percentiles."""
+    return get_scheduler().stats()
+
+
+@router.get("/usage", summary="Gemini token and cost report")
+async def usage_report(day: str | None = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$")) -> Dict[str, Any]:
+    """Return per-tenant token/cost totals and budget tier for a UTC day, plus per-route totals."""
+    return get_usage_ledger().report(day)
@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from functools import lru_cache
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
+from app.config import get_settings
+from app.core.http_cache import compress, etag_matches, negotiate_encoding
+from app.core.serialization import typed_response
+from app.graph.catalog import CATALOG_VERSION, get_role
+from app.graph.roadmap_planner import plan_roadmap
 from app.schemas.agents import (
+    CatalogRoadmapResponse,
     ProfileRequest,
     ProfileResponse,
     RoadmapRequest,
@@ -15,22 +24,47 @@ from app.schemas.agents import (
 )
 from app.services.gmail import send_roadmap_email
 from app.services.graph_runner import GraphRunner, get_graph_runner
+from app.services.scheduler import BULK, INTERACTIVE, SchedulerOverloaded, get_scheduler
+from app.services.usage import get_tenant
 
 router = APIRouter(prefix="/agents", tags=["agents"])
 
 
+def get_traffic_class(x_traffic_class: str | None = Header(default=None)) -> str:
+    """Classify the caller from its authenticated tenant; tenants in ``BULK_TENANTS`` run as bulk.
+
+    ``X-Traffic-Class: bulk`` only lets other callers downgrade themselves; it can't raise a bulk
+    tenant to interactive.
+    """
+    bulk_tenants = {tenant.strip() for tenant in get_settings().bulk_tenants.split(",") if tenant.strip()}
+    if get_tenant() in bulk_tenants or (x_traffic_class or "").strip().lower() == BULK:
+        return BULK
+    return INTERACTIVE
+
+
+async def _run_graph(runner: GraphRunner, initial_state: dict, traffic_class: str) -> dict:
+    """Run the graph once the scheduler admits this traffic class; shed load with a 503."""
+    try:
+        return await get_scheduler().run(traffic_class, runner.run, initial_state)
+    except SchedulerOverloaded as exc:
+        logger.warning("Shedding {} request: {}", traffic_class, exc)
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "1"}) from exc
+
+
 @router.post("/profile", response_model=ProfileResponse)
 async def build_profile(
     payload: ProfileRequest,
     runner: GraphRunner = Depends(get_graph_runner),
-) -> ProfileResponse:
+    traffic_class: str = Depends(get_traffic_class),
+) -> ORJSONResponse:
     """Return normalized profile data based on conversational inputs."""
-    state = runner.run({"seeker_profile": payload.seeker_profile.model_dump()})
+    state = await _run_graph(runner, {"seeker_profile": payload.seeker_profile.model_dump()}, traffic_class)
     if "normalized_profile" not in state:
         logger.error("Normalized profile missing from graph state")
         raise HTTPException(status_code=500, detail="Graph did not return normalized profile")
 
-    return ProfileResponse(
+    return typed_response(
+        ProfileResponse,
         normalized_profile=state["normalized_profile"],
         errors=state.get("errors", []),
     )
@@ -40,14 +74,17 @@ async def build_profile(
 async def get_role_fit(
     payload: RoleFitRequest,
     runner: GraphRunner = Depends(get_graph_runner),
-) -> RoleFitResponse:
+    traffic_class: str = Depends(get_traffic_class),
+) -> ORJSONResponse:
     """Run the full pipeline to retrieve role matches and summary."""
-    state = runner.run({"seeker_profile": payload.seeker_profile.model_dump()})
+    state = await _run_graph(runner, {"seeker_profile": payload.seeker_profile.model_dump()}, traffic_class)
 
-    return RoleFitResponse(
+    return typed_response(
+        RoleFitResponse,
         role_candidates=state.get("role_candidates", []),
         selected_role_id=state.get("selected_role_id"),
         summary=state.get("summary"),
+        job_leads=state.get("job_leads", []),
         errors=state.get("errors", []),
     )
 
@@ -56,7 +93,8 @@ async def get_role_fit(
 async def get_roadmap(
     payload: RoadmapRequest,
     runner: GraphRunner = Depends(get_graph_runner),
-) -> RoadmapResponse:
+    traffic_class: str = Depends(get_traffic_class),
+) -> ORJSONResponse:
     """Return roadmap for a supplied role or latest recommendation."""
     base_state = {}
     if payload.seeker_profile:
@@ -64,15 +102,63 @@ async def get_roadmap(
     if payload.role_id:
         base_state["selected_role_id"] = payload.role_id
 
-    state = runner.run(base_state)
+    state = await _run_graph(runner, base_state, traffic_class)
     email_status = None
     if payload.email and state.get("summary"):
         email_status = send_roadmap_email(payload.email, state["summary"])
 
-    return RoadmapResponse(
+    return typed_response(
+        RoadmapResponse,
         role_id=state.get("selected_role_id"),
         roadmap=state.get("roadmap", []),
         summary=state.get("summary"),
+        job_leads=state.get("job_leads", []),
         email_status=email_status,
         errors=state.get("errors", []),
     )
+
+
+@lru_cache(maxsize=256)
+def _catalog_roadmap_body(role_id: str, version: str, encoding: str | None) -> bytes:
+    """Serialize (and optionally compress) a role's catalog roadmap once per catalog version."""
+    if encoding:
+        return compress(_catalog_roadmap_body(role_id, version, None), encoding)
+    role = get_role(role_id)
+    roadmap = plan_roadmap(role_id, [])
+    return typed_response(
+        CatalogRoadmapResponse,
+        role_id=role_id,
+        title=role["title"],
+        roadmap=roadmap,
+        total_weeks=sum(step.get("duration_weeks", 0) for step in roadmap),
+        catalog_version=version,
+    ).body
+
+
+@router.get("/roadmaps/{role_id}", response_model=CatalogRoadmapResponse)
+async def get_catalog_roadmap(
+    role_id: str,
+    if_none_match: str | None = Header(default=None),
+    accept_encoding: str | None = Header(default=None),
+) -> Response:
+    """Serve a role's full roadmap from the catalog with ETag revalidation and compression."""
+    if get_role(role_id) is None:
+        raise HTTPException(status_code=404, detail="Unknown role_id")
+
+    settings = get_settings()
+    body = _catalog_roadmap_body(role_id, CATALOG_VERSION, None)
+    encoding = negotiate_encoding(accept_encoding) if len(body) >= settings.compression_min_bytes else None
+    # Encoded bytes differ, so each encoding gets its own strong validator, on 200 and 304 alike.
+    etag = f'"{CATALOG_VERSION}-{role_id}-{encoding}"' if encoding else f'"{CATALOG_VERSION}-{role_id}"'
+    headers = {
+        "Cache-Control": f"public, max-age={settings.roadmap_cache_max_age}",
+        "Vary": "Accept-Encoding",
+        "ETag": etag,
+    }
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    if encoding:
+        body = _catalog_roadmap_body(role_id, CATALOG_VERSION, encoding)
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,8 +1,15 @@
 """Health and readiness endpoints for infrastructure monitoring."""
 
+from typing import Any
+
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
+from app.services.dependency_probes import get_probe_monitor
+from app.services.llm import get_llm_breaker
+from app.services.model_router import get_model_router
+
 router = APIRouter()
 
 
@@ -14,8 +21,17 @@ async def health() -> dict[str, str]:
 
 
 @router.get("/readiness", summary="Readiness check")
-async def readiness() -> dict[str, str]:
-    """Return readiness status (expand with downstream checks when available)."""
+async def readiness() -> ORJSONResponse:
+    """Return readiness from the cached dependency probes, plus Gemini breaker and route stats.
+
+    Answers 503 while a critical dependency's last probe failed; never waits on a dependency.
+    """
     logger.bind(request_id="-").debug("Readiness check invoked")
-    # TODO: add checks for Redis, Mongo, etc. when integrated
-    return {"status": "ready"}
+    probes = get_probe_monitor().snapshot()
+    body: dict[str, Any] = {
+        "status": "ready" if probes["ready"] else "not_ready",
+        "dependencies": probes["dependencies"],
+        "llm_circuit": get_llm_breaker().snapshot(),
+        "llm_routes": get_model_router().stats(),
+    }
+    return ORJSONResponse(body, status_code=200 if probes["ready"] else 503)
@@ -42,10 +42,22 @@ class RoleRecommendationModel(BaseModel):
     rationale: str
 
 
+class JobLeadModel(BaseModel):
+    job_id: str
+    role_id: str
+    employer: str
+    location: str
+    salary_min: int
+    salary_max: int
+    shift: Optional[str] = None
+    status: str = "open"
+
+
 class RoleFitResponse(BaseModel):
     role_candidates: List[RoleRecommendationModel]
     selected_role_id: Optional[str]
     summary: Optional[str]
+    job_leads: List[JobLeadModel] = []
     errors: List[str] = []
 
 
@@ -66,5 +78,14 @@ class RoadmapResponse(BaseModel):
     role_id: Optional[str]
     roadmap: List[RoadmapStepModel]
     summary: Optional[str]
+    job_leads: List[JobLeadModel] = []
     email_status: Optional[str]
     errors: List[str] = []
+
+
+class CatalogRoadmapResponse(BaseModel):
+    role_id: str
+    title: str
+    roadmap: List[RoadmapStepModel]
+    total_weeks: int
+    catalog_version: str
@@ -0,0 +1,235 @@
+"""Offline, resumable batch scorer for re-ranking seeker profiles stored as JSON Lines.
+
+Streams the input file, normalizes and heuristically scores profiles in chunks across a process
+pool, optionally re-ranks them with Gemini under bounded async concurrency, and appends results
+to the output file in input order. A checkpoint written after every chunk records how far the
+input and output got, so a crashed run resumes where it stopped. The checkpoint also pins the input
+file (path, size, mtime) and the catalog version; a run against a changed input or catalog refuses
+to resume rather than keep stale scores::
+
+    python -m app.services.batch_scorer seekers.jsonl scores.jsonl --workers 4 --chunk-size 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Tuple
+
+from loguru import logger
+
+from app.core.serialization import dumps, loads
+from app.graph.catalog import CATALOG_VERSION
+from app.graph.nodes import heuristic_recommendations, normalize_profile, rank_roles
+from app.graph.roadmap_planner import plan_roadmap
+
+Chunk = Tuple[int, List[bytes]]  # (input offset after the chunk's last line, raw lines)
+
+
+class CheckpointMismatchError(RuntimeError):
+    """Raised when a checkpoint belongs to a different input file or catalog version."""
+
+
+def input_fingerprint(path: Path) -> Dict[str, Any]:
+    """Identify the input a checkpoint's byte offsets refer to."""
+
+    stat = path.stat()
+    return {"path": str(path.resolve()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def iter_chunks(path: Path, start_offset: int, chunk_size: int) -> Iterator[Chunk]:
+    """Yield raw line chunks from ``start_offset`` without reading the whole file."""
+
+    with path.open("rb") as handle:
+        handle.seek(start_offset)
+        lines: List[bytes] = []
+        for line in handle:
+            if line.strip():
+                lines.append(line)
+            if len(lines) >= chunk_size:
+                yield handle.tell(), lines
+                lines = []
+        if lines:
+            yield handle.tell(), lines
+
+
+def _score_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    profile = record.get("seeker_profile", record)
+    normalized = normalize_profile(profile)
+    candidates = heuristic_recommendations(normalized)
+    return _result(record, normalized, candidates, errors=[])
+
+
+def _result(record: Dict[str, Any], normalized: dict, candidates: list, errors: List[str]) -> Dict[str, Any]:
+    selected_role_id = candidates[0]["role_id"] if candidates else None
+    try:
+        roadmap = plan_roadmap(selected_role_id, normalized["skills"]) if selected_role_id else []
+    except KeyError:
+        roadmap, errors = [], [*errors, "Selected role not found in library"]
+    return {
+        "seeker_id": record.get("seeker_id") or record.get("id"),
+        "normalized_profile": normalized,
+        "role_candidates": candidates,
+        "selected_role_id": selected_role_id,
+        "roadmap_weeks": sum(step.get("duration_weeks", 0) for step in roadmap),
+        "errors": errors,
+    }
+
+
+def score_chunk(lines: List[bytes]) -> List[Dict[str, Any]]:
+    """Process-pool worker: parse and heuristically score one chunk of JSONL records."""
+
+    results = []
+    for line in lines:
+        try:
+            results.append(_score_record(loads(line)))
+        except Exception as exc:  # one bad row must not sink the chunk
+            results.append({"seeker_id": None, "errors": [f"Unparseable record: {exc}"]})
+    return results
+
+
+async def rerank_with_llm(results: List[Dict[str, Any]], concurrency: int) -> None:
+    """Replace heuristic rankings with Gemini rankings, at most ``concurrency`` calls at a time."""
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def rerank(result: Dict[str, Any]) -> None:
+        if "normalized_profile" not in result:
+            return
+        async with semaphore:
+            candidates, errors = await asyncio.to_thread(rank_roles, result["normalized_profile"])
+        result.update(_result(result, result["normalized_profile"], candidates, result["errors"] + errors))
+
+    await asyncio.gather(*(rerank(result) for result in results))
+
+
+class Checkpoint:
+    """Atomically persisted progress marker: input offset, output size and record count.
+
+    ``input`` and ``catalog_version`` record what the offsets and scores were produced from.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.input_offset = 0
+        self.output_bytes = 0
+        self.records = 0
+        self.input: Dict[str, Any] | None = None
+        self.catalog_version: str | None = None
+        if path.exists():
+            data = loads(path.read_bytes())
+            self.input_offset = data["input_offset"]
+            self.output_bytes = data["output_bytes"]
+            self.records = data["records"]
+            self.input = data.get("input")
+            self.catalog_version = data.get("catalog_version")
+
+    def save(self) -> None:
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(
+            dumps(
+                {
+                    "input_offset": self.input_offset,
+                    "output_bytes": self.output_bytes,
+                    "records": self.records,
+                    "input": self.input,
+                    "catalog_version": self.catalog_version,
+                }
+            )
+        )
+        os.replace(tmp_path, self.path)
+
+
+def run(
+    input_path: Path,
+    output_path: Path,
+    checkpoint_path: Path,
+    workers: int,
+    chunk_size: int,
+    use_llm: bool = False,
+    llm_concurrency: int = 4,
+) -> int:
+    """Score ``input_path`` into ``output_path``, resuming from ``checkpoint_path`` when present."""
+
+    if not checkpoint_path.exists() and output_path.exists() and output_path.stat().st_size:
+        raise FileExistsError(f"{output_path} has data but no checkpoint; refusing to overwrite it")
+    resuming = checkpoint_path.exists()
+    checkpoint = Checkpoint(checkpoint_path)
+    fingerprint = input_fingerprint(input_path)
+    if resuming and (checkpoint.input, checkpoint.catalog_version) != (fingerprint, CATALOG_VERSION):
+        raise CheckpointMismatchError(
+            f"{checkpoint_path} was written for input {checkpoint.input} and catalog "
+            f"{checkpoint.catalog_version}, not {fingerprint} and {CATALOG_VERSION}; "
+            f"remove it and {output_path} to re-score from scratch"
+        )
+    checkpoint.input, checkpoint.catalog_version = fingerprint, CATALOG_VERSION
+    if checkpoint.input_offset:
+        logger.info("Resuming after {} records (input byte {})", checkpoint.records, checkpoint.input_offset)
+
+    with output_path.open("ab") as output:
+        # Drop anything written after the last checkpoint (a chunk interrupted mid-write).
+        output.truncate(checkpoint.output_bytes)
+        output.seek(checkpoint.output_bytes)
+
+        # Keep a bounded number of chunks in flight so memory stays flat regardless of file size.
+        max_in_flight = workers * 2
+        in_flight: Deque[Tuple[int, Future]] = deque()
+        chunks = iter_chunks(input_path, checkpoint.input_offset, chunk_size)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while True:
+                while len(in_flight) < max_in_flight:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    end_offset, lines = chunk
+                    in_flight.append((end_offset, pool.submit(score_chunk, lines)))
+                if not in_flight:
+                    break
+
+                end_offset, future = in_flight.popleft()
+                results = future.result()
+                if use_llm:
+                    asyncio.run(rerank_with_llm(results, llm_concurrency))
+                output.write(b"".join(dumps(result).encode("utf-8") + b"\n" for result in results))
+                output.flush()
+                os.fsync(output.fileno())
+
+                checkpoint.input_offset = end_offset
+                checkpoint.output_bytes = output.tell()
+                checkpoint.records += len(results)
+                checkpoint.save()
+                logger.info("Scored {} records", checkpoint.records)
+
+    return checkpoint.records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-score seeker profiles from a JSONL file.")
+    parser.add_argument("input", type=Path, help="JSONL file with one seeker (or {seeker_profile: ...}) per line")
+    parser.add_argument("output", type=Path, help="JSONL file to append scored results to")
+    parser.add_argument("--checkpoint", type=Path, help="defaults to <output>.checkpoint")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--llm", action="store_true", help="re-rank with Gemini after heuristic scoring")
+    parser.add_argument("--llm-concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    records = run(
+        args.input,
+        args.output,
+        args.checkpoint or args.output.with_name(args.output.name + ".checkpoint"),
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        use_llm=args.llm,
+        llm_concurrency=args.llm_concurrency,
+    )
+    logger.info("Batch scoring finished: {} records written to {}", records, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Background dependency probes whose cached results back the readiness endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+import redis
+from loguru import logger
+
+from app.config import get_settings
+from app.services.llm import get_llm
+from app.services.usage import get_usage_ledger, usage_from_message
+
+OK = "ok"
+FAILING = "failing"
+UNKNOWN = "unknown"
+DISABLED = "disabled"
+
+
+@dataclass
+class ProbeResult:
+    status: str = UNKNOWN
+    latency_ms: Optional[float] = None
+    checked_at: Optional[float] = None  # time.time() of the last completed check
+    error: Optional[str] = None
+
+
+@dataclass
+class DependencyProbe:
+    """A blocking health check for one dependency; ``check=None`` marks it as not configured."""
+
+    name: str
+    check: Optional[Callable[[], None]]
+    interval_seconds: float
+    critical: bool = True
+
+
+class ProbeMonitor:
+    """Runs each probe on its own interval in a background task and caches the latest result.
+
+    Checks run in worker threads bounded by ``timeout_seconds``, so ``/readiness`` only reads the
+    cache and never waits on a dependency. A result older than ``stale_after`` probe intervals
+    counts as failing, so a wedged probe loop can't keep reporting a healthy pod.
+    """
+
+    def __init__(self, probes: List[DependencyProbe], timeout_seconds: float = 3.0, stale_after: float = 3.0) -> None:
+        self.probes = probes
+        self.timeout_seconds = timeout_seconds
+        self.stale_after = stale_after
+        self._results: Dict[str, ProbeResult] = {
+            probe.name: ProbeResult(status=UNKNOWN if probe.check else DISABLED) for probe in probes
+        }
+        self._task: asyncio.Task | None = None
+        # Checks that timed out keep their thread; don't start another until they return.
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    async def _run_probe(self, probe: DependencyProbe) -> None:
+        pending = self._pending.get(probe.name)
+        if pending is not None and not pending.done():
+            self._results[probe.name] = ProbeResult(
+                status=FAILING, checked_at=time.time(), error="previous check still running"
+            )
+            return
+        started = time.perf_counter()
+        future = asyncio.get_running_loop().run_in_executor(None, probe.check)
+        self._pending[probe.name] = future
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.timeout_seconds)
+        except asyncio.TimeoutError:
+            status, error = FAILING, f"timed out after {self.timeout_seconds}s"
+        except Exception as exc:
+            status, error = FAILING, f"{type(exc).__name__}: {exc}"[:300]
+        else:
+            status, error = OK, None
+        previous = self._results[probe.name].status
+        self._results[probe.name] = ProbeResult(
+            status=status,
+            latency_ms=round((time.perf_counter() - started) * 1000, 1),
+            checked_at=time.time(),
+            error=error,
+        )
+        if status != previous:
+            log = logger.info if status == OK else logger.warning
+            log("Dependency {} is now {}{}", probe.name, status, f" ({error})" if error else "")
+
+    async def run_once(self, names: Optional[List[str]] = None) -> None:
+        """Probe every enabled dependency (or just ``names``) concurrently."""
+
+        await asyncio.gather(
+            *(
+                self._run_probe(probe)
+                for probe in self.probes
+                if probe.check and (names is None or probe.name in names)
+            )
+        )
+
+    async def _loop(self) -> None:
+        intervals = {probe.name: probe.interval_seconds for probe in self.probes}
+        next_due = {probe.name: time.monotonic() + probe.interval_seconds for probe in self.probes if probe.check}
+        while next_due:
+            await asyncio.sleep(max(0.0, min(next_due.values()) - time.monotonic()))
+            now = time.monotonic()
+            due = [name for name, at in next_due.items() if at <= now]
+            try:
+                await self.run_once(due)
+            except Exception as exc:  # pragma: no cover - keep probing whatever happens
+                logger.exception("Dependency probe round failed: {}", exc)
+            for name in due:
+                next_due[name] = time.monotonic() + intervals[name]
+
+    async def start(self) -> None:
+        """Run a first probe round (so readiness is accurate from the start), then keep probing."""
+
+        if self._task is not None:
+            return
+        await self.run_once()
+        self._task = asyncio.create_task(self._loop(), name="dependency-probes")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _effective_status(self, probe: DependencyProbe, result: ProbeResult) -> str:
+        if result.status in (OK, FAILING) and result.checked_at is not None:
+            if time.time() - result.checked_at > probe.interval_seconds * self.stale_after + self.timeout_seconds:
+                return FAILING
+        return result.status
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return overall readiness and per-dependency status, latency and result age."""
+
+        now = time.time()
+        dependencies: Dict[str, Dict[str, Any]] = {}
+        ready = True
+        for probe in self.probes:
+            result = self._results[probe.name]
+            status = self._effective_status(probe, result)
+            # Unknown (not probed yet) doesn't fail readiness; only an observed failure does.
+            if probe.critical and status == FAILING:
+                ready = False
+            dependencies[probe.name] = {
+                "status": status,
+                "critical": probe.critical,
+                "latency_ms": result.latency_ms,
+                "age_seconds": round(now - result.checked_at, 1) if result.checked_at else None,
+                "error": result.error,
+            }
+        return {"ready": ready, "dependencies": dependencies}
+
+
+def _llm_check() -> None:
+    """Ping the lite model; the spend shows in the ``readiness`` route totals, not a tenant budget."""
+
+    model_name = get_settings().gemini_lite_model_name
+    message = get_llm(model_name=model_name, max_output_tokens=1, temperature=0.0).invoke("ping")
+    get_usage_ledger().record(None, usage_from_message("readiness", model_name, "ping", message))
+
+
+def _redis_check(url: str, timeout: float) -> Callable[[], None]:
+    client = redis.Redis.from_url(url, socket_connect_timeout=timeout, socket_timeout=timeout)
+
+    def check() -> None:
+        client.ping()
+
+    return check
+
+
+def _core_service_check(base_url: str, timeout: float) -> Callable[[], None]:
+    def check() -> None:
+        httpx.get(f"{base_url.rstrip('/')}/roles", timeout=timeout).raise_for_status()
+
+    return check
+
+
+@lru_cache
+def get_probe_monitor() -> ProbeMonitor:
+    """Return the process-wide probe monitor configured from settings."""
+
+    settings = get_settings()
+    timeout = settings.readiness_probe_timeout_seconds
+    interval = settings.readiness_probe_interval_seconds
+    critical = {name.strip() for name in settings.readiness_critical_dependencies.split(",") if name.strip()}
+    # Pinging Gemini costs tokens in every worker, so only probe it when it gates readiness.
+    # Replayed/recorded cassettes would need a recorded ping; skip the LLM probe there too.
+    llm_check = _llm_check if "llm" in critical and settings.llm_cassette_mode == "off" else None
+    return ProbeMonitor(
+        [
+            DependencyProbe("llm", llm_check, settings.readiness_llm_probe_interval_seconds, "llm" in critical),
+            DependencyProbe(
+                "redis",
+                _redis_check(settings.redis_url, timeout) if settings.redis_url else None,
+                interval,
+                "redis" in critical,
+            ),
+            DependencyProbe(
+                "core_service",
+                _core_service_check(settings.core_service_url, timeout) if settings.core_service_url else None,
+                interval,
+                "core_service" in critical,
+            ),
+        ],
+        timeout_seconds=timeout,
+    )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+from functools import lru_cache
 from typing import Any, Dict
 
 from loguru import logger
@@ -10,6 +12,8 @@ from langsmith.run_trees import RunTree
 
 from app.config import get_settings
 from app.graph import build_seeker_graph
+from app.services.profiling import get_node_timings
+from app.services.usage import get_tenant, summarize_usage
 
 
 class GraphRunner:
@@ -38,9 +42,15 @@ class GraphRunner:
                 project_name=self.langsmith_project,
                 metadata={"request_id": request_id} if request_id else None,
             )
+        started = time.perf_counter()
         try:
             result = self.graph.invoke(initial_state)
+            timings = get_node_timings()
+            if timings is not None:
+                timings["graph_total"] = (time.perf_counter() - started) * 1000
             logger.debug("Graph run completed with keys: {}", list(result.keys()))
+            if result.get("llm_usage"):
+                logger.info("LLM usage for tenant {}: {}", get_tenant(), summarize_usage(result["llm_usage"]))
             if run_tree and self.langsmith_client:
                 run_tree.end(outputs=result)
                 run_tree.post(self.langsmith_client)
@@ -52,6 +62,7 @@ class GraphRunner:
             raise
 
 
+@lru_cache
 def get_graph_runner() -> GraphRunner:
     """Factory returning a GraphRunner instance (cached via FastAPI dependency)."""
     return GraphRunner()
@@ -0,0 +1,245 @@
+"""In-memory job lead index built from bulk core-service job snapshots."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+from app.config import get_settings
+from app.core.serialization import loads
+
+if TYPE_CHECKING:  # pragma: no cover - app.graph imports this module
+    from app.graph.state import JobLead
+
+_SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
+
+
+def role_key(title: str) -> str:
+    """Return the slug used to bucket jobs by role (``"MERN Support Intern"`` -> ``"mern-support-intern"``)."""
+    return _SLUG_PATTERN.sub("-", title.lower()).strip("-")
+
+
+def _location_key(location: str | None) -> str:
+    return (location or "").strip().lower()
+
+
+@dataclass
+class _SalaryBucket:
+    """Jobs sorted by ``(salary_max, job_id)`` so salary floors resolve with one bisect."""
+
+    keys: List[Tuple[int, str]] = field(default_factory=list)
+
+    def add(self, job: JobLead) -> None:
+        insort(self.keys, (job["salary_max"], job["job_id"]))
+
+    def remove(self, job: JobLead) -> None:
+        key = (job["salary_max"], job["job_id"])
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            self.keys.pop(index)
+
+    def top(self, salary_floor: int, k: int) -> List[str]:
+        """Return up to ``k`` job ids paying at least ``salary_floor``, best paid first."""
+        start = bisect_left(self.keys, (salary_floor, ""))
+        stop = max(start, len(self.keys) - k)
+        return [job_id for _, job_id in reversed(self.keys[stop:])]
+
+
+class JobIndex:
+    """Holds open job postings indexed by role, location and salary band.
+
+    The snapshot is fetched in bulk from core-service and refreshed incrementally using the
+    ``updatedSince`` filter; a periodic full reload picks up hard deletes. Jobs are keyed by the
+    agent catalog's ``role_id``, resolved from the core-service role title through ``role_ids``
+    (``role_key(title) -> role_id``); titles the catalog doesn't know keep their slug.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        ttl_seconds: float = 300,
+        full_refresh_seconds: float = 3600,
+        timeout_seconds: float = 5.0,
+        role_ids: Dict[str, str] | None = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.role_ids = role_ids or {}
+        self.ttl_seconds = ttl_seconds
+        self.full_refresh_seconds = full_refresh_seconds
+        self.timeout_seconds = timeout_seconds
+
+        self._jobs: Dict[str, JobLead] = {}
+        self._by_role: Dict[str, _SalaryBucket] = {}
+        self._by_role_location: Dict[Tuple[str, str], _SalaryBucket] = {}
+        self._watermark: str | None = None
+        self._lock = threading.Lock()
+        self._refreshing = threading.Event()
+        self._last_attempt = 0.0
+        self._last_full_refresh = 0.0
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    # -- indexing -----------------------------------------------------------------
+
+    def parse_job(self, doc: Dict[str, Any]) -> Optional[JobLead]:
+        """Convert a core-service ``JobPosting`` document into a ``JobLead``."""
+
+        role = doc.get("role")
+        if isinstance(role, dict):
+            slug = role_key(role.get("title") or str(role.get("_id", "")))
+            role_id = self.role_ids.get(slug, slug)
+        elif role:
+            role_id = str(role)
+        else:
+            return None
+        salary_min = int(doc.get("salaryMin") or 0)
+        salary_max = int(doc.get("salaryMax") or salary_min)
+        return {
+            "job_id": str(doc.get("_id") or doc.get("id")),
+            "role_id": role_id,
+            "employer": doc.get("employer") or "",
+            "location": doc.get("location") or "",
+            "salary_min": salary_min,
+            "salary_max": salary_max,
+            "shift": doc.get("shift"),
+            "status": doc.get("status") or "open",
+        }
+
+    def _add(self, job: JobLead) -> None:
+        self._jobs[job["job_id"]] = job
+        self._by_role.setdefault(job["role_id"], _SalaryBucket()).add(job)
+        key = (job["role_id"], _location_key(job["location"]))
+        self._by_role_location.setdefault(key, _SalaryBucket()).add(job)
+
+    def _remove(self, job_id: str) -> None:
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return
+        self._by_role[job["role_id"]].remove(job)
+        self._by_role_location[(job["role_id"], _location_key(job["location"]))].remove(job)
+
+    def load(self, docs: Iterable[Dict[str, Any]], full: bool = True) -> int:
+        """Index ``docs``; a full load replaces the snapshot, otherwise rows are upserted."""
+
+        parsed = []
+        watermark = None if full else self._watermark
+        for doc in docs:
+            updated_at = doc.get("updatedAt")
+            if updated_at and (watermark is None or updated_at > watermark):
+                watermark = updated_at
+            job = self.parse_job(doc)
+            if job is not None:
+                parsed.append(job)
+
+        if full:
+            # Build the replacement snapshot off-lock and sort each bucket once.
+            jobs = {job["job_id"]: job for job in parsed if job["status"] == "open"}
+            by_role: Dict[str, _SalaryBucket] = {}
+            by_role_location: Dict[Tuple[str, str], _SalaryBucket] = {}
+            for job in jobs.values():
+                key = (job["salary_max"], job["job_id"])
+                by_role.setdefault(job["role_id"], _SalaryBucket()).keys.append(key)
+                location = (job["role_id"], _location_key(job["location"]))
+                by_role_location.setdefault(location, _SalaryBucket()).keys.append(key)
+            for bucket in (*by_role.values(), *by_role_location.values()):
+                bucket.keys.sort()
+            with self._lock:
+                self._jobs, self._by_role, self._by_role_location = jobs, by_role, by_role_location
+                self._watermark = watermark
+            return len(parsed)
+
+        with self._lock:
+            for job in parsed:
+                self._remove(job["job_id"])
+                if job["status"] == "open":
+                    self._add(job)
+            self._watermark = watermark
+        return len(parsed)
+
+    # -- querying -----------------------------------------------------------------
+
+    def top_k(
+        self,
+        role_id: str,
+        location: str | None = None,
+        salary_expectation: int | None = None,
+        k: int = 5,
+    ) -> List[JobLead]:
+        """Return the best-paid open jobs for ``role_id`` that satisfy the seeker's constraints."""
+
+        with self._lock:
+            if location:
+                bucket = self._by_role_location.get((role_id, _location_key(location)))
+            else:
+                bucket = self._by_role.get(role_id)
+            if bucket is None:
+                return []
+            return [self._jobs[job_id] for job_id in bucket.top(salary_expectation or 0, k)]
+
+    # -- refreshing ---------------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Fetch jobs from core-service; incremental unless a full reload is due."""
+
+        if not self.base_url:
+            return
+        now = time.monotonic()
+        self._last_attempt = now
+        full = self._watermark is None or now - self._last_full_refresh >= self.full_refresh_seconds
+        params = {} if full else {"updatedSince": self._watermark}
+        try:
+            response = httpx.get(f"{self.base_url}/jobs", params=params, timeout=self.timeout_seconds)
+            response.raise_for_status()
+            count = self.load(loads(response.content), full=full)
+        except (httpx.HTTPError, ValueError) as exc:
+            logger.warning("Job snapshot refresh failed: {}", exc)
+            return
+        if full:
+            self._last_full_refresh = now
+        logger.info(
+            "Job snapshot {} refresh indexed {} postings ({} open)",
+            "full" if full else "incremental",
+            count,
+            len(self),
+        )
+
+    def refresh_if_stale(self) -> None:
+        """Kick off a background refresh when the snapshot is older than the TTL; never blocks."""
+
+        if not self.base_url or self._refreshing.is_set():
+            return
+        if self._last_attempt and time.monotonic() - self._last_attempt < self.ttl_seconds:
+            return
+        self._refreshing.set()
+
+        def _worker() -> None:
+            try:
+                self.refresh()
+            finally:
+                self._refreshing.clear()
+
+        threading.Thread(target=_worker, name="job-index-refresh", daemon=True).start()
+
+
+@lru_cache
+def get_job_index() -> JobIndex:
+    """Return the process-wide job index configured from settings."""
+
+    from app.graph.catalog import ROLE_LIBRARY  # deferred: app.graph imports this module
+
+    settings = get_settings()
+    return JobIndex(
+        base_url=settings.core_service_url,
+        ttl_seconds=settings.job_snapshot_ttl_seconds,
+        full_refresh_seconds=settings.job_snapshot_full_refresh_seconds,
+        role_ids={role_key(role["title"]): role["role_id"] for role in ROLE_LIBRARY},
+    )
@@ -1,27 +1,202 @@
-"""Utility helpers for initializing Gemini LLM clients."""
+"""Utility helpers for initializing Gemini LLM clients and guarding calls to them."""
 
 from __future__ import annotations
 
+import threading
+import time
+from collections import deque
 from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, Tuple, Type, TypeVar
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 from loguru import logger
 
 from app.config import get_settings
+from app.services.llm_cassette import CassetteMissError, RecordingLLM, ReplayLLM, get_cassette
+
+T = TypeVar("T")
 
 
 @lru_cache
-def get_llm() -> ChatGoogleGenerativeAI:
-    """Return a cached Gemini chat client configured from environment variables."""
+def get_llm(
+    model_name: str | None = None,
+    max_output_tokens: int = 1024,
+    temperature: float = 0.2,
+) -> ChatGoogleGenerativeAI | RecordingLLM | ReplayLLM:
+    """Return a cached Gemini chat client per (model, token cap, temperature).
+
+    ``LLM_CASSETTE_MODE=record`` wraps the client so exchanges are saved to the cassette;
+    ``replay`` serves them back from the cassette without creating a network client.
+    """
 
     settings = get_settings()
+    model_name = model_name or settings.gemini_model_name
+    if settings.llm_cassette_mode == "replay":
+        return ReplayLLM(get_cassette(), model_name, latency=settings.llm_replay_latency)
     try:
-        return ChatGoogleGenerativeAI(
-            model=settings.gemini_model_name,
+        client = ChatGoogleGenerativeAI(
+            model=model_name,
             google_api_key=settings.google_api_key,
-            temperature=0.2,
-            max_output_tokens=1024,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
         )
     except Exception as exc:  # pragma: no cover - initialization failure
         logger.exception("Failed to initialize Gemini client: {}", exc)
         raise
+    if settings.llm_cassette_mode == "record":
+        return RecordingLLM(client, get_cassette(), model_name)
+    return client
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling Gemini while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker driven by the failure rate over a sliding time window.
+
+    While open, calls fail immediately with ``CircuitOpenError`` so callers can take their
+    heuristic/template path without waiting on the network. After ``cooldown_seconds`` a limited
+    number of half-open probes decide whether to close again or re-open. Exceptions listed in
+    ``ignored_exceptions`` (local problems such as a cassette miss) propagate without counting as
+    failures.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        window_seconds: float = 60.0,
+        min_calls: int = 4,
+        cooldown_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        ignored_exceptions: Tuple[Type[BaseException], ...] = (),
+    ) -> None:
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.cooldown_seconds = cooldown_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.ignored_exceptions = ignored_exceptions
+
+        self._state = self.CLOSED
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == self.OPEN and now - self._opened_at >= self.cooldown_seconds:
+            self._state = self.HALF_OPEN
+            self._half_open_in_flight = 0
+        return self._state
+
+    def _prune(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+
+    def _trip(self, now: float) -> None:
+        self._state = self.OPEN
+        self._opened_at = now
+        self._outcomes.clear()
+        logger.warning("Circuit '{}' opened; skipping calls for {}s", self.name, self.cooldown_seconds)
+
+    def allow_request(self) -> bool:
+        """Return True when a call may go out (reserving a probe slot when half-open)."""
+
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and self._half_open_in_flight < self.half_open_max_calls:
+                self._half_open_in_flight += 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._state == self.HALF_OPEN:
+                self._state = self.CLOSED
+                self._outcomes.clear()
+                logger.info("Circuit '{}' closed after successful probe", self.name)
+                return
+            self._outcomes.append((now, True))
+            self._prune(now)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._state == self.HALF_OPEN:
+                self._trip(now)
+                return
+            self._outcomes.append((now, False))
+            self._prune(now)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.failure_rate_threshold:
+                self._trip(now)
+
+    def _release(self) -> None:
+        """Give back a half-open probe slot without recording an outcome."""
+
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._half_open_in_flight:
+                self._half_open_in_flight -= 1
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Invoke ``func`` through the breaker, recording its outcome."""
+
+        if not self.allow_request():
+            raise CircuitOpenError(f"{self.name} circuit is open")
+        try:
+            result = func(*args, **kwargs)
+        except self.ignored_exceptions:
+            self._release()
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return breaker state and window counters for readiness/metrics endpoints."""
+
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            self._prune(now)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            return {
+                "state": state,
+                "window_calls": len(self._outcomes),
+                "window_failures": failures,
+                "retry_in_seconds": (
+                    round(max(0.0, self.cooldown_seconds - (now - self._opened_at)), 1) if state == self.OPEN else 0.0
+                ),
+            }
+
+
+@lru_cache
+def get_llm_breaker() -> CircuitBreaker:
+    """Return the process-wide circuit breaker guarding Gemini calls."""
+
+    settings = get_settings()
+    return CircuitBreaker(
+        name="gemini",
+        failure_rate_threshold=settings.llm_breaker_failure_rate,
+        window_seconds=settings.llm_breaker_window_seconds,
+        min_calls=settings.llm_breaker_min_calls,
+        cooldown_seconds=settings.llm_breaker_cooldown_seconds,
+        ignored_exceptions=(CassetteMissError,),
+    )
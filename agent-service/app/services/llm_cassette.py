@@ -0,0 +1,158 @@
+"""Record/replay transport for Gemini calls so the pipeline can be benchmarked offline."""
+
+from __future__ import annotations
+
+import atexit
+import gzip
+import hashlib
+import threading
+import time
+from collections import defaultdict, deque
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any, Deque, Dict, Optional
+
+from langchain_core.messages import AIMessage
+from loguru import logger
+
+from app.config import get_settings
+from app.core.serialization import dumps, loads
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a prompt was never recorded (prompt template drift)."""
+
+
+def prompt_key(model_name: str, prompt: str) -> str:
+    return hashlib.sha256(f"{model_name}\n{prompt}".encode("utf-8")).hexdigest()[:24]
+
+
+def _message_text(message: AIMessage) -> str:
+    content = message.content
+    if isinstance(content, list):
+        return "".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+    return str(content)
+
+
+class Cassette:
+    """Append-only JSON Lines file (gzip when the path ends in ``.gz``) of recorded LLM exchanges.
+
+    Each line holds the model, prompt, response text, usage metadata and observed latency. Replays of
+    a prompt recorded several times are served in recording order, cycling once exhausted.
+
+    A recording session keeps one writer open, so a gzip cassette gets a single compressed stream
+    per session instead of one tiny member per exchange; ``close()`` (run at exit for the
+    configured cassette) finishes it.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._entries: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._writer: IO[str] | None = None
+
+    def _open(self, mode: str):
+        if self.path.suffix == ".gz":
+            return gzip.open(self.path, mode + "t", encoding="utf-8")
+        return self.path.open(mode, encoding="utf-8")
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_writer()
+
+    def load(self) -> int:
+        with self._lock:
+            self._close_writer()  # so everything recorded so far is readable
+            self._entries.clear()
+            count = 0
+            if self.path.exists():
+                with self._open("r") as handle:
+                    for line in handle:
+                        if line.strip():
+                            entry = loads(line)
+                            self._entries[entry["key"]].append(entry)
+                            count += 1
+            self._loaded = True
+        return count
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            if self._writer is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._writer = self._open("a")
+            self._writer.write(dumps(entry) + "\n")
+            self._entries[entry["key"]].append(entry)
+
+    def next_entry(self, key: str) -> Dict[str, Any]:
+        if not self._loaded:
+            self.load()
+        with self._lock:
+            queue = self._entries.get(key)
+            if not queue:
+                raise CassetteMissError(f"No recorded response for prompt {key} in {self.path}")
+            entry = queue.popleft()
+            queue.append(entry)
+            return entry
+
+
+class RecordingLLM:
+    """Wraps a real chat model and appends every exchange to the cassette."""
+
+    def __init__(self, inner: Any, cassette: Cassette, model_name: str) -> None:
+        self.inner = inner
+        self.cassette = cassette
+        self.model_name = model_name
+
+    def invoke(self, prompt: str, *args: Any, **kwargs: Any) -> AIMessage:
+        started = time.perf_counter()
+        message = self.inner.invoke(prompt, *args, **kwargs)
+        latency_ms = (time.perf_counter() - started) * 1000
+        self.cassette.append(
+            {
+                "key": prompt_key(self.model_name, prompt),
+                "model": self.model_name,
+                "prompt": prompt,
+                "text": _message_text(message),
+                "usage": getattr(message, "usage_metadata", None),
+                "latency_ms": round(latency_ms, 1),
+            }
+        )
+        return message
+
+
+class ReplayLLM:
+    """Serves recorded responses without touching the network.
+
+    ``latency="realistic"`` sleeps for the recorded latency; ``"zero"`` returns immediately.
+    """
+
+    def __init__(self, cassette: Cassette, model_name: str, latency: str = "realistic") -> None:
+        self.cassette = cassette
+        self.model_name = model_name
+        self.latency = latency
+
+    def invoke(self, prompt: str, *args: Any, **kwargs: Any) -> AIMessage:
+        entry = self.cassette.next_entry(prompt_key(self.model_name, prompt))
+        if self.latency == "realistic":
+            time.sleep(entry.get("latency_ms", 0) / 1000)
+        usage: Optional[Dict[str, Any]] = entry.get("usage")
+        return AIMessage(
+            content=[{"type": "text", "text": entry["text"]}],
+            usage_metadata=usage,
+            response_metadata={"model_name": self.model_name, "replayed": True},
+        )
+
+
+@lru_cache
+def get_cassette() -> Cassette:
+    """Return the cassette configured by ``LLM_CASSETTE_PATH``."""
+    cassette = Cassette(get_settings().llm_cassette_path)
+    atexit.register(cassette.close)
+    logger.info("LLM cassette at {}", cassette.path)
+    return cassette
@@ -0,0 +1,137 @@
+"""Per-node model routing with fallback chains and latency tracking."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence
+
+from app.config import get_settings
+
+# Smoothing factor for the per-route latency moving average.
+_EWMA_ALPHA = 0.2
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """A model choice for one graph node, with its own token cap."""
+
+    node: str
+    model_name: str
+    max_output_tokens: int
+    temperature: float = 0.2
+
+    @property
+    def key(self) -> str:
+        return f"{self.node}:{self.model_name}"
+
+    def llm_kwargs(self) -> Dict[str, Any]:
+        """Arguments for ``get_llm`` that select this route's client."""
+        return {
+            "model_name": self.model_name,
+            "max_output_tokens": self.max_output_tokens,
+            "temperature": self.temperature,
+        }
+
+
+@dataclass
+class RouteStats:
+    calls: int = 0
+    errors: int = 0
+    ewma_ms: float | None = None
+    max_ms: float = 0.0
+
+
+class ModelRouter:
+    """Chooses the model chain for a node and records how each route performs.
+
+    ``chain`` returns the primary route followed by its fallbacks. When a latency budget is given,
+    routes whose observed moving-average latency exceeds it are skipped, keeping the fastest one
+    if none fit. ``economy=True`` (a tenant near its token budget) swaps in the economy model alone.
+    """
+
+    def __init__(self, routes: Dict[str, Sequence[ModelRoute]], economy_model: str | None = None) -> None:
+        self.routes = {node: list(chain) for node, chain in routes.items()}
+        self.economy_model = economy_model
+        self._stats: Dict[str, RouteStats] = {}
+        self._lock = threading.Lock()
+
+    def chain(self, node: str, latency_budget_ms: float | None = None, economy: bool = False) -> List[ModelRoute]:
+        routes = self.routes[node]
+        if economy and self.economy_model:
+            return [replace(routes[0], model_name=self.economy_model)]
+        if latency_budget_ms is None:
+            return list(routes)
+        with self._lock:
+            latencies = {route.key: self._stats.get(route.key, RouteStats()).ewma_ms for route in routes}
+        within_budget = [r for r in routes if latencies[r.key] is None or latencies[r.key] <= latency_budget_ms]
+        if within_budget:
+            return within_budget
+        return [min(routes, key=lambda r: latencies[r.key] or 0.0)]
+
+    def record(self, route: ModelRoute, latency_ms: float, ok: bool) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(route.key, RouteStats())
+            stats.calls += 1
+            if not ok:
+                stats.errors += 1
+            stats.max_ms = max(stats.max_ms, latency_ms)
+            stats.ewma_ms = (
+                latency_ms if stats.ewma_ms is None else _EWMA_ALPHA * latency_ms + (1 - _EWMA_ALPHA) * stats.ewma_ms
+            )
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                key: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "ewma_ms": round(stats.ewma_ms, 1) if stats.ewma_ms is not None else None,
+                    "max_ms": round(stats.max_ms, 1),
+                }
+                for key, stats in self._stats.items()
+            }
+
+
+def _with_fallbacks(node: str, primary: Sequence[ModelRoute], fallbacks: Sequence[str]) -> List[ModelRoute]:
+    chain = list(primary)
+    seen = {route.model_name for route in chain}
+    cap = chain[-1].max_output_tokens
+    for model_name in fallbacks:
+        if model_name not in seen:
+            chain.append(ModelRoute(node, model_name, cap))
+            seen.add(model_name)
+    return chain
+
+
+@lru_cache
+def get_model_router() -> ModelRouter:
+    """Return the process-wide router built from ``Settings``."""
+
+    settings = get_settings()
+    fallbacks = [name.strip() for name in settings.gemini_fallback_models.split(",") if name.strip()]
+    ranking = ModelRoute("ranking", settings.gemini_model_name, settings.ranking_max_output_tokens)
+    return ModelRouter(
+        {
+            "ranking": _with_fallbacks("ranking", [ranking], fallbacks),
+            # Close heuristic calls go to the stronger model first, then the regular ranking model.
+            "ranking_ambiguous": _with_fallbacks(
+                "ranking_ambiguous",
+                [
+                    ModelRoute("ranking_ambiguous", settings.gemini_strong_model_name, settings.ranking_max_output_tokens),
+                    ModelRoute("ranking_ambiguous", settings.gemini_model_name, settings.ranking_max_output_tokens),
+                ],
+                fallbacks,
+            ),
+            "summary": _with_fallbacks(
+                "summary",
+                [
+                    ModelRoute("summary", settings.gemini_lite_model_name, settings.summary_max_output_tokens),
+                    ModelRoute("summary", settings.gemini_model_name, settings.summary_max_output_tokens),
+                ],
+                fallbacks,
+            ),
+        },
+        economy_model=settings.gemini_lite_model_name,
+    )
@@ -0,0 +1,139 @@
+"""Per-request node timings, slow-request ring buffer and profile artifact storage."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from pyinstrument import Profiler
+from pyinstrument.session import Session
+
+from app.config import get_settings
+
+_node_timings_ctx_var: ContextVar[Dict[str, float] | None] = ContextVar("node_timings", default=None)
+_profile_sessions_ctx_var: ContextVar[List[Session] | None] = ContextVar("profile_sessions", default=None)
+_SAFE_REQUEST_ID = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def start_node_timings() -> Dict[str, float]:
+    """Begin collecting node timings for the current request and return the collector."""
+    timings: Dict[str, float] = {}
+    _node_timings_ctx_var.set(timings)
+    return timings
+
+
+def get_node_timings() -> Dict[str, float] | None:
+    """Return the timing collector of the current request, if one was started."""
+    return _node_timings_ctx_var.get()
+
+
+def start_profile_capture(active: bool) -> List[Session] | None:
+    """Mark whether the current request is profiled; return the list collecting worker-thread sessions."""
+    sessions: List[Session] | None = [] if active else None
+    _profile_sessions_ctx_var.set(sessions)
+    return sessions
+
+
+def call_profiled(func: Callable, *args: Any) -> Any:
+    """Run ``func`` in the calling thread, sampling that thread if the request is being profiled.
+
+    The request's own profiler only follows the event-loop thread, so work handed to the
+    threadpool is profiled here and merged into the request's artifact afterwards.
+    """
+
+    sessions = _profile_sessions_ctx_var.get()
+    if sessions is None:
+        return func(*args)
+    profiler = Profiler(interval=0.001, async_mode="disabled")
+    profiler.start()
+    try:
+        return func(*args)
+    finally:
+        profiler.stop()
+        sessions.append(profiler.last_session)
+
+
+def timed_node(name: str, func: Callable) -> Callable:
+    """Wrap a LangGraph node so its wall time (ms) lands in the request's timing collector."""
+
+    @wraps(func)
+    def wrapper(state):
+        started = time.perf_counter()
+        try:
+            return func(state)
+        finally:
+            timings = _node_timings_ctx_var.get()
+            if timings is not None:
+                timings[name] = timings.get(name, 0.0) + (time.perf_counter() - started) * 1000
+
+    return wrapper
+
+
+@dataclass
+class RequestTiming:
+    request_id: str
+    method: str
+    path: str
+    duration_ms: float
+    nodes_ms: Dict[str, float] = field(default_factory=dict)
+    profile_artifact: Optional[str] = None
+    finished_at: float = field(default_factory=time.time)
+
+
+class SlowRequestLog:
+    """Ring buffer of recent graph-backed requests, queried for the slowest entries."""
+
+    def __init__(self, size: int = 200) -> None:
+        self._entries: Deque[RequestTiming] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, entry: RequestTiming) -> None:
+        with self._lock:
+            self._entries.append(entry)
+
+    def slowest(self, limit: int = 10) -> List[Dict[str, Any]]:
+        with self._lock:
+            entries = sorted(self._entries, key=lambda entry: entry.duration_ms, reverse=True)[:limit]
+        return [
+            {
+                **asdict(entry),
+                "duration_ms": round(entry.duration_ms, 2),
+                "nodes_ms": {node: round(ms, 2) for node, ms in entry.nodes_ms.items()},
+            }
+            for entry in entries
+        ]
+
+
+class ProfileStore:
+    """Writes speedscope profiles to disk keyed by (sanitized) request ID."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = Path(directory)
+
+    def path_for(self, request_id: str) -> Path:
+        return self.directory / f"{_SAFE_REQUEST_ID.sub('_', request_id)[:128]}.speedscope.json"
+
+    def save(self, request_id: str, payload: str) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(request_id)
+        path.write_text(payload, encoding="utf-8")
+        return path
+
+
+@lru_cache
+def get_slow_request_log() -> SlowRequestLog:
+    """Return the process-wide slow request ring buffer."""
+    return SlowRequestLog(get_settings().slow_request_buffer_size)
+
+
+@lru_cache
+def get_profile_store() -> ProfileStore:
+    """Return the profile artifact store configured from settings."""
+    return ProfileStore(get_settings().profile_dir)
@@ -0,0 +1,166 @@
+"""Priority-aware admission control in front of the graph runner."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, TypeVar
+
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.services.profiling import call_profiled
+
+T = TypeVar("T")
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+
+class SchedulerOverloaded(RuntimeError):
+    """Raised when a traffic class's queue is full and the request should be shed."""
+
+
+@dataclass
+class TrafficClass:
+    """Scheduling parameters and live counters for one class of traffic."""
+
+    name: str
+    weight: float
+    max_concurrency: int
+    max_queue: int
+    waiters: Deque[asyncio.Future] = field(default_factory=deque)
+    in_flight: int = 0
+    virtual_time: float = 0.0
+    admitted: int = 0
+    rejected: int = 0
+    queue_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+
+def _percentile(values: Deque[float], pct: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct))], 2)
+
+
+class AdmissionScheduler:
+    """Admits graph runs up to a shared capacity using weighted fair queuing across classes.
+
+    Each class has its own FIFO queue, a concurrency cap and a weight. When a slot frees up, the
+    eligible class with the lowest virtual time goes next and its virtual time advances by
+    ``1 / weight``, so a class with weight 8 gets eight admissions for every one of a weight-1
+    class while both are backlogged, and bulk work still drains whenever interactive queues are
+    empty.
+    """
+
+    def __init__(self, capacity: int, classes: Dict[str, TrafficClass]) -> None:
+        self.capacity = capacity
+        self.classes = classes
+        self._in_flight = 0
+
+    def _pick(self) -> TrafficClass | None:
+        eligible = [c for c in self.classes.values() if c.waiters and c.in_flight < c.max_concurrency]
+        return min(eligible, key=lambda c: c.virtual_time, default=None)
+
+    def _dispatch(self) -> None:
+        while self._in_flight < self.capacity:
+            traffic_class = self._pick()
+            if traffic_class is None:
+                return
+            waiter = traffic_class.waiters.popleft()
+            if waiter.done():  # caller gave up (client disconnect / cancellation)
+                continue
+            self._admit(traffic_class)
+            waiter.set_result(None)
+
+    def _admit(self, traffic_class: TrafficClass) -> None:
+        # Classes that were idle restart at the current minimum so they can't bank credit.
+        floor = min((c.virtual_time for c in self.classes.values() if c.waiters or c.in_flight), default=0.0)
+        traffic_class.virtual_time = max(traffic_class.virtual_time, floor) + 1 / traffic_class.weight
+        traffic_class.in_flight += 1
+        traffic_class.admitted += 1
+        self._in_flight += 1
+
+    async def acquire(self, name: str) -> None:
+        traffic_class = self.classes[name]
+        started = time.perf_counter()
+        if (
+            not traffic_class.waiters
+            and self._in_flight < self.capacity
+            and traffic_class.in_flight < traffic_class.max_concurrency
+        ):
+            self._admit(traffic_class)
+        else:
+            if len(traffic_class.waiters) >= traffic_class.max_queue:
+                traffic_class.rejected += 1
+                raise SchedulerOverloaded(f"{name} queue is full")
+            waiter = asyncio.get_running_loop().create_future()
+            traffic_class.waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self.release(name)  # admitted just as we were cancelled
+                raise
+        traffic_class.queue_ms.append((time.perf_counter() - started) * 1000)
+
+    def release(self, name: str) -> None:
+        self.classes[name].in_flight -= 1
+        self._in_flight -= 1
+        self._dispatch()
+
+    async def run(self, name: str, func: Callable[..., T], *args: Any) -> T:
+        """Wait for admission under ``name``, then run ``func`` off the event loop."""
+
+        await self.acquire(name)
+        try:
+            return await run_in_threadpool(call_profiled, func, *args)
+        finally:
+            self.release(name)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "in_flight": self._in_flight,
+            "classes": {
+                c.name: {
+                    "weight": c.weight,
+                    "max_concurrency": c.max_concurrency,
+                    "in_flight": c.in_flight,
+                    "queued": len(c.waiters),
+                    "admitted": c.admitted,
+                    "rejected": c.rejected,
+                    "queue_ms_p50": _percentile(c.queue_ms, 0.5),
+                    "queue_ms_p95": _percentile(c.queue_ms, 0.95),
+                }
+                for c in self.classes.values()
+            },
+        }
+
+
+@lru_cache
+def get_scheduler() -> AdmissionScheduler:
+    """Return the process-wide scheduler configured from settings."""
+
+    settings = get_settings()
+    return AdmissionScheduler(
+        capacity=settings.scheduler_capacity,
+        classes={
+            INTERACTIVE: TrafficClass(
+                INTERACTIVE,
+                weight=settings.interactive_weight,
+                max_concurrency=settings.scheduler_capacity,
+                max_queue=settings.interactive_max_queue,
+            ),
+            BULK: TrafficClass(
+                BULK,
+                weight=settings.bulk_weight,
+                max_concurrency=settings.bulk_max_concurrency,
+                max_queue=settings.bulk_max_queue,
+            ),
+        },
+    )
@@ -0,0 +1,313 @@
+"""Gemini token/cost accounting and daily per-tenant token budgets.
+
+Counters live in Redis (``REDIS_URL``) so every gunicorn worker and pod charges the same daily
+budget and ``/admin/usage`` reports the whole deployment. Without Redis (or while it errors) the
+ledger falls back to in-process counters, which are per worker and reset when a worker recycles.
+"""
+
+from __future__ import annotations
+
+import hmac
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+import redis
+from langchain_core.messages import AIMessage
+from loguru import logger
+
+from app.config import get_settings
+
+if TYPE_CHECKING:  # pragma: no cover - app.graph imports this module via the nodes
+    from app.graph.state import LlmUsage
+
+# USD per million (input, output) tokens; models not listed are counted at zero cost.
+_PRICE_PER_MILLION_TOKENS: Dict[str, Tuple[float, float]] = {
+    "gemini-2.5-pro": (1.25, 10.0),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-flash-lite": (0.10, 0.40),
+}
+# Days of totals kept for the usage report (also the Redis key TTL).
+_RETAINED_DAYS = 7
+# After a Redis error, count locally for this long before trying the shared store again.
+_STORE_RETRY_SECONDS = 30.0
+_COUNTER_FIELDS = ("calls", "input_tokens", "output_tokens", "total_tokens")
+
+NORMAL = "normal"
+ECONOMY = "economy"
+EXHAUSTED = "exhausted"
+
+_tenant_ctx_var: ContextVar[str | None] = ContextVar("tenant", default=None)
+_usage_ctx_var: ContextVar["List[LlmUsage] | None"] = ContextVar("llm_usage", default=None)
+
+
+def _tenant_keys() -> Dict[str, str]:
+    """Parse ``TENANT_API_KEYS`` (``tenant:key,...``) into ``{key: tenant}``."""
+
+    pairs = (item.strip().partition(":") for item in get_settings().tenant_api_keys.split(","))
+    return {key.strip(): tenant.strip() for tenant, _, key in pairs if tenant.strip() and key.strip()}
+
+
+def resolve_tenant(api_key: str | None) -> str | None:
+    """Return the tenant whose configured key matches ``X-Tenant-Key``, or None.
+
+    Tenants are only ever taken from configured keys, so callers can't dodge a budget (or grow
+    the ledger) by inventing tenant names; unknown or missing keys count as the default tenant.
+    """
+
+    if not api_key:
+        return None
+    for key, tenant in _tenant_keys().items():
+        if hmac.compare_digest(api_key, key):
+            return tenant
+    return None
+
+
+def set_tenant(tenant: str | None) -> None:
+    """Attach the resolved calling tenant to the current context."""
+    _tenant_ctx_var.set(tenant)
+
+
+def get_tenant() -> str:
+    """Return the current tenant, or the configured default outside a tenant-tagged request."""
+    return _tenant_ctx_var.get() or get_settings().default_tenant
+
+
+@contextmanager
+def capture_usage() -> Iterator[List[LlmUsage]]:
+    """Collect the usage entries of every LLM call made inside the block (e.g. one graph node)."""
+
+    entries: List[LlmUsage] = []
+    token = _usage_ctx_var.set(entries)
+    try:
+        yield entries
+    finally:
+        _usage_ctx_var.reset(token)
+
+
+def _today() -> str:
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def _cost_usd(model_name: str, input_tokens: int, output_tokens: int) -> float:
+    input_price, output_price = _PRICE_PER_MILLION_TOKENS.get(model_name.removeprefix("models/"), (0.0, 0.0))
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+def usage_from_message(node: str, model_name: str, prompt: str, message: AIMessage) -> LlmUsage:
+    """Build a usage entry from the message's ``usage_metadata``.
+
+    Clients that don't report usage (stubs, old cassettes) are estimated at ~4 characters per token
+    so budgets still apply; such entries are flagged ``estimated``.
+    """
+
+    metadata = getattr(message, "usage_metadata", None) or {}
+    estimated = not metadata
+    if estimated:
+        content = message.content
+        text = (
+            "".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+            if isinstance(content, list)
+            else str(content)
+        )
+        input_tokens, output_tokens = len(prompt) // 4, len(text) // 4
+        total_tokens = input_tokens + output_tokens
+    else:
+        input_tokens = int(metadata.get("input_tokens", 0))
+        output_tokens = int(metadata.get("output_tokens", 0))
+        total_tokens = int(metadata.get("total_tokens", input_tokens + output_tokens))
+    return {
+        "node": node,
+        "model": model_name,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": total_tokens,
+        "cost_usd": round(_cost_usd(model_name, input_tokens, output_tokens), 6),
+        "estimated": estimated,
+    }
+
+
+def summarize_usage(entries: List[LlmUsage]) -> Dict[str, Any]:
+    """Totals across a list of usage entries (e.g. one request's ``llm_usage`` state)."""
+
+    return {
+        "calls": len(entries),
+        "input_tokens": sum(entry["input_tokens"] for entry in entries),
+        "output_tokens": sum(entry["output_tokens"] for entry in entries),
+        "total_tokens": sum(entry["total_tokens"] for entry in entries),
+        "cost_usd": round(sum(entry["cost_usd"] for entry in entries), 6),
+    }
+
+
+@dataclass
+class UsageTotals:
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    cost_usd: float = 0.0
+
+    def add(self, entry: LlmUsage) -> None:
+        self.calls += 1
+        self.input_tokens += entry["input_tokens"]
+        self.output_tokens += entry["output_tokens"]
+        self.total_tokens += entry["total_tokens"]
+        self.cost_usd += entry["cost_usd"]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "cost_usd": round(self.cost_usd, 6)}
+
+
+class LocalUsageStore:
+    """In-process counters keyed by (day, scope, name); per worker, lost on restart."""
+
+    def __init__(self) -> None:
+        self._totals: Dict[Tuple[str, str, str], UsageTotals] = {}
+        self._lock = threading.Lock()
+
+    def add(self, day: str, scope: str, name: str, entry: LlmUsage) -> None:
+        with self._lock:
+            if (day, scope, name) not in self._totals:
+                cutoff = (date.fromisoformat(day) - timedelta(days=_RETAINED_DAYS)).isoformat()
+                self._totals = {key: totals for key, totals in self._totals.items() if key[0] > cutoff}
+            self._totals.setdefault((day, scope, name), UsageTotals()).add(entry)
+
+    def get(self, day: str, scope: str, name: str) -> UsageTotals:
+        with self._lock:
+            totals = self._totals.get((day, scope, name))
+            return UsageTotals(**asdict(totals)) if totals else UsageTotals()
+
+    def all(self, day: str, scope: str) -> Dict[str, UsageTotals]:
+        with self._lock:
+            return {key[2]: UsageTotals(**asdict(t)) for key, t in self._totals.items() if key[:2] == (day, scope)}
+
+
+class RedisUsageStore:
+    """Shared counters: one Redis hash per (day, scope, name) plus a per-day member set, with a TTL."""
+
+    def __init__(self, client: redis.Redis, prefix: str = "llm-usage") -> None:
+        self.client = client
+        self.prefix = prefix
+        self.ttl_seconds = (_RETAINED_DAYS + 1) * 86400
+
+    def _key(self, day: str, scope: str, name: str) -> str:
+        return f"{self.prefix}:{day}:{scope}:{name}"
+
+    def add(self, day: str, scope: str, name: str, entry: LlmUsage) -> None:
+        key, members = self._key(day, scope, name), f"{self.prefix}:{day}:{scope}"
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hincrby(key, "calls", 1)
+        for field in _COUNTER_FIELDS[1:]:
+            pipe.hincrby(key, field, entry[field])
+        pipe.hincrbyfloat(key, "cost_usd", entry["cost_usd"])
+        pipe.expire(key, self.ttl_seconds)
+        pipe.sadd(members, name)
+        pipe.expire(members, self.ttl_seconds)
+        pipe.execute()
+
+    @staticmethod
+    def _totals(raw: Dict[Any, Any]) -> UsageTotals:
+        data = {(k.decode() if isinstance(k, bytes) else k): v for k, v in raw.items()}
+        return UsageTotals(
+            **{field: int(data.get(field, 0)) for field in _COUNTER_FIELDS},
+            cost_usd=float(data.get("cost_usd", 0.0)),
+        )
+
+    def get(self, day: str, scope: str, name: str) -> UsageTotals:
+        return self._totals(self.client.hgetall(self._key(day, scope, name)))
+
+    def all(self, day: str, scope: str) -> Dict[str, UsageTotals]:
+        members = self.client.smembers(f"{self.prefix}:{day}:{scope}")
+        names = sorted(m.decode() if isinstance(m, bytes) else m for m in members)
+        return {name: self.get(day, scope, name) for name in names}
+
+
+class UsageLedger:
+    """Token totals per (UTC day, tenant) and per (UTC day, node, model), with budget tiers.
+
+    A tenant starts on the ``normal`` tier, moves to ``economy`` (cheapest model only) once it has
+    spent ``economy_ratio`` of its daily token budget, and to ``exhausted`` (no LLM calls; callers
+    use their heuristic/template paths) when the budget is gone. Budgets reset at UTC midnight.
+    When the shared store errors, counting continues in a local fallback store (fail open) for
+    ``_STORE_RETRY_SECONDS`` before the shared store is tried again.
+    """
+
+    def __init__(
+        self,
+        daily_token_budget: Optional[int] = None,
+        economy_ratio: float = 0.8,
+        store: LocalUsageStore | RedisUsageStore | None = None,
+    ) -> None:
+        self.daily_token_budget = daily_token_budget
+        self.economy_ratio = economy_ratio
+        self.store = store or LocalUsageStore()
+        self._fallback = self.store if isinstance(self.store, LocalUsageStore) else LocalUsageStore()
+        self._store_retry_at = 0.0
+
+    def _call(self, method: str, *args: Any) -> Any:
+        if self.store is not self._fallback and time.monotonic() >= self._store_retry_at:
+            try:
+                return getattr(self.store, method)(*args)
+            except redis.RedisError as exc:
+                self._store_retry_at = time.monotonic() + _STORE_RETRY_SECONDS
+                logger.warning("Usage store unavailable ({}); using per-process counters", exc)
+        return getattr(self._fallback, method)(*args)
+
+    def record(self, tenant: str | None, entry: LlmUsage) -> None:
+        """Add one call to the ledger and to the active ``capture_usage`` block, if any.
+
+        ``tenant=None`` (service-internal calls such as readiness pings) only counts toward the
+        per-route totals and charges no tenant's budget.
+        """
+
+        day = _today()
+        if tenant is not None:
+            self._call("add", day, "tenant", tenant, entry)
+        self._call("add", day, "route", f"{entry['node']}:{entry['model']}", entry)
+        captured = _usage_ctx_var.get()
+        if captured is not None:
+            captured.append(entry)
+
+    def spent_today(self, tenant: str) -> int:
+        return self._call("get", _today(), "tenant", tenant).total_tokens
+
+    def tier(self, tenant: str) -> str:
+        if self.daily_token_budget is None:
+            return NORMAL
+        spent = self.spent_today(tenant)
+        if spent >= self.daily_token_budget:
+            return EXHAUSTED
+        if spent >= self.daily_token_budget * self.economy_ratio:
+            return ECONOMY
+        return NORMAL
+
+    def report(self, day: Optional[str] = None) -> Dict[str, Any]:
+        day = day or _today()
+        tenants = {tenant: totals.as_dict() for tenant, totals in self._call("all", day, "tenant").items()}
+        routes = {route: totals.as_dict() for route, totals in self._call("all", day, "route").items()}
+        for tenant, totals in tenants.items():
+            totals["tier"] = self.tier(tenant) if day == _today() else None
+        return {
+            "day": day,
+            "daily_token_budget": self.daily_token_budget,
+            "store": "redis" if isinstance(self.store, RedisUsageStore) else "process",
+            "tenants": tenants,
+            "routes": routes,
+        }
+
+
+@lru_cache
+def get_usage_ledger() -> UsageLedger:
+    """Return the usage ledger, backed by Redis when ``REDIS_URL`` is configured."""
+
+    settings = get_settings()
+    store = None
+    if settings.redis_url:
+        client = redis.Redis.from_url(settings.redis_url, socket_connect_timeout=0.5, socket_timeout=0.5)
+        store = RedisUsageStore(client)
+    return UsageLedger(settings.tenant_daily_token_budget, settings.tenant_economy_ratio, store)
@@ -14,14 +14,14 @@ class DummyLLM:
         if "rank the best 3 roles" in prompt:
             payload = [
                 {
-                    "role_id": "delivery-executive",
-                    "title": "Delivery Executive",
+                    "role_id": "edge-ai-field-tech",
+                    "title": "Edge AI Field Technician",
                     "match_score": 0.8,
                     "rationale": "LLM match",
                 }
             ]
             return AIMessage(content=[{"type": "text", "text": json.dumps(payload)}])
-        return AIMessage(content=[{"type": "text", "text": "Delivery Executive fits well with a short roadmap."}])
+        return AIMessage(content=[{"type": "text", "text": "Edge AI Field Technician fits well with a short roadmap."}])
 
 
 @patch("app.graph.nodes.get_llm", return_value=DummyLLM())
@@ -69,3 +69,41 @@ def test_roadmap_endpoint_can_email(mock_llm):
     data = response.json()
     assert "roadmap" in data
     assert data["email_status"] in (None, "queued", "Gmail credentials missing; email skipped")
+
+
+def test_catalog_roadmap_supports_conditional_get():
+    response = client.get("/agents/roadmaps/mern-support-intern")
+    assert response.status_code == 200
+    assert response.json()["total_weeks"] == 4
+    assert response.headers["Cache-Control"].startswith("public")
+    etag = response.headers["ETag"]
+
+    cached = client.get("/agents/roadmaps/mern-support-intern", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    assert client.get("/agents/roadmaps/unknown-role").status_code == 404
+
+
+def test_catalog_roadmap_compresses_large_payloads(monkeypatch):
+    from app.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "compression_min_bytes", 0)
+    response = client.get("/agents/roadmaps/ai-data-ops-associate", headers={"Accept-Encoding": "br;q=0, gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"].endswith('-gzip"')
+    assert response.json()["roadmap"][0]["title"] == "Labeling playbook"
+
+
+def test_catalog_roadmap_304_carries_the_negotiated_variant_etag(monkeypatch):
+    from app.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "compression_min_bytes", 0)
+    headers = {"Accept-Encoding": "gzip"}
+    first = client.get("/agents/roadmaps/mern-support-intern", headers=headers)
+    etag = first.headers["ETag"]
+    assert etag.endswith('-gzip"')
+
+    cached = client.get("/agents/roadmaps/mern-support-intern", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from app.services import batch_scorer
+
+
+def _write_profiles(path, count):
+    with path.open("w") as handle:
+        for index in range(count):
+            profile = {"skills": ["Python", "Excel"] if index % 2 else ["HTML"], "personality": ["analytical"]}
+            handle.write(json.dumps({"seeker_id": f"s{index}", "seeker_profile": profile}) + "\n")
+        handle.write("{not json}\n")
+
+
+def test_batch_scorer_writes_results_in_order(tmp_path):
+    source, output = tmp_path / "seekers.jsonl", tmp_path / "scores.jsonl"
+    _write_profiles(source, 7)
+
+    records = batch_scorer.run(source, output, tmp_path / "ckpt", workers=2, chunk_size=3)
+
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert records == 8
+    assert [row["seeker_id"] for row in rows[:7]] == [f"s{index}" for index in range(7)]
+    assert rows[1]["selected_role_id"] == "ai-data-ops-associate"
+    assert rows[7]["errors"][0].startswith("Unparseable record")
+
+
+def test_batch_scorer_resumes_from_checkpoint(tmp_path):
+    source, output, checkpoint_path = tmp_path / "seekers.jsonl", tmp_path / "scores.jsonl", tmp_path / "ckpt"
+    _write_profiles(source, 5)
+    batch_scorer.run(source, output, checkpoint_path, workers=1, chunk_size=2)
+    expected = output.read_text()
+
+    # Simulate a crash after the first chunk: rewind the checkpoint and leave a torn write behind.
+    checkpoint = batch_scorer.Checkpoint(checkpoint_path)
+    first_chunk = expected.splitlines(keepends=True)[:2]
+    checkpoint.input_offset = len("".join(source.read_text().splitlines(keepends=True)[:2]).encode())
+    checkpoint.output_bytes = len("".join(first_chunk).encode())
+    checkpoint.records = 2
+    checkpoint.save()
+    with output.open("a") as handle:
+        handle.write('{"seeker_id": "torn')
+
+    assert batch_scorer.run(source, output, checkpoint_path, workers=1, chunk_size=2) == 6
+    assert output.read_text() == expected
+
+
+def test_checkpoint_refuses_a_changed_catalog_or_input(tmp_path, monkeypatch):
+    source, output, checkpoint_path = tmp_path / "seekers.jsonl", tmp_path / "scores.jsonl", tmp_path / "ckpt"
+    _write_profiles(source, 4)
+    batch_scorer.run(source, output, checkpoint_path, workers=1, chunk_size=2)
+    assert batch_scorer.run(source, output, checkpoint_path, workers=1, chunk_size=2) == 5  # nothing new to do
+
+    monkeypatch.setattr(batch_scorer, "CATALOG_VERSION", "new-catalog")
+    with pytest.raises(batch_scorer.CheckpointMismatchError, match="catalog"):
+        batch_scorer.run(source, output, checkpoint_path, workers=1, chunk_size=2)
+    monkeypatch.undo()
+
+    _write_profiles(source, 9)  # regenerated input: old byte offsets mean nothing in it
+    with pytest.raises(batch_scorer.CheckpointMismatchError):
+        batch_scorer.run(source, output, checkpoint_path, workers=1, chunk_size=2)
@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from langchain_core.messages import AIMessage
+
+from app.main import app
+from app.services.dependency_probes import DependencyProbe, ProbeMonitor, _llm_check, get_probe_monitor
+from app.services.usage import UsageLedger
+
+client = TestClient(app)
+
+
+def _fail():
+    raise ConnectionError("connection refused")
+
+
+def test_probe_results_are_cached_with_status_and_latency():
+    monitor = ProbeMonitor(
+        [
+            DependencyProbe("redis", lambda: None, 15),
+            DependencyProbe("core_service", _fail, 15),
+            DependencyProbe("llm", lambda: time.sleep(0.5), 60, critical=False),
+            DependencyProbe("mongo", None, 15),
+        ],
+        timeout_seconds=0.1,
+    )
+    assert monitor.snapshot()["ready"]  # nothing probed yet
+
+    asyncio.run(monitor.run_once())
+    snapshot = monitor.snapshot()
+    deps = snapshot["dependencies"]
+    assert deps["redis"]["status"] == "ok" and deps["redis"]["latency_ms"] is not None
+    assert deps["core_service"]["status"] == "failing" and "refused" in deps["core_service"]["error"]
+    assert deps["llm"]["status"] == "failing" and "timed out" in deps["llm"]["error"]
+    assert deps["mongo"]["status"] == "disabled"
+    assert not snapshot["ready"]  # core_service is critical; the slow LLM is not
+
+
+def test_stale_results_count_as_failing():
+    monitor = ProbeMonitor([DependencyProbe("redis", lambda: None, 1)], timeout_seconds=0.1)
+    asyncio.run(monitor.run_once())
+    monitor._results["redis"].checked_at -= 10
+    assert monitor.snapshot()["dependencies"]["redis"]["status"] == "failing"
+
+
+def test_readiness_returns_503_when_a_critical_dependency_fails(monkeypatch):
+    failing = ProbeMonitor([DependencyProbe("core_service", _fail, 15)], timeout_seconds=0.1)
+    asyncio.run(failing.run_once())
+    monkeypatch.setattr("app.routers.health.get_probe_monitor", lambda: failing)
+
+    response = client.get("/readiness")
+    assert response.status_code == 503
+    assert response.json()["status"] == "not_ready"
+    assert response.json()["dependencies"]["core_service"]["status"] == "failing"
+
+
+def test_hung_check_is_not_restarted_while_running():
+    calls = []
+
+    def hang():
+        calls.append(1)
+        time.sleep(0.3)
+
+    monitor = ProbeMonitor([DependencyProbe("llm", hang, 60)], timeout_seconds=0.05)
+
+    async def two_rounds():
+        await monitor.run_once()
+        await monitor.run_once()
+
+    asyncio.run(two_rounds())
+    assert len(calls) == 1
+    assert monitor.snapshot()["dependencies"]["llm"]["error"] == "previous check still running"
+
+
+def test_llm_is_not_critical_or_probed_by_default():
+    probes = {probe.name: probe for probe in get_probe_monitor().probes}
+    assert not probes["llm"].critical and probes["llm"].check is None
+    assert probes["redis"].critical and probes["core_service"].critical
+
+
+def test_llm_probe_usage_is_recorded_under_readiness_only():
+    ledger = UsageLedger()
+
+    class PingLLM:
+        def invoke(self, prompt):
+            return AIMessage(content="p", usage_metadata={"input_tokens": 1, "output_tokens": 1, "total_tokens": 2})
+
+    with patch("app.services.dependency_probes.get_llm", return_value=PingLLM()), patch(
+        "app.services.dependency_probes.get_usage_ledger", return_value=ledger
+    ):
+        _llm_check()
+    report = ledger.report()
+    assert report["tenants"] == {}  # no tenant budget is charged
+    routes = report["routes"]
+    assert [route.split(":")[0] for route in routes] == ["readiness"]
+    assert next(iter(routes.values()))["total_tokens"] == 2
@@ -1,9 +1,15 @@
 import json
+import threading
+import time
 from unittest.mock import patch
 
+import pytest
+
 from langchain_core.messages import AIMessage
 
 from app.graph import build_seeker_graph
+from app.graph.catalog import ROLE_LIBRARY
+from app.graph.nodes import _parse_recommendations, heuristic_recommendations, normalize_profile
 
 
 class DummyLLM:
@@ -11,15 +17,15 @@ class DummyLLM:
         if "rank the best 3 roles" in prompt:
             payload = [
                 {
-                    "role_id": "warehouse-associate",
-                    "title": "Warehouse Associate",
+                    "role_id": "ai-data-ops-associate",
+                    "title": "AI Data Ops Associate",
                     "match_score": 0.9,
                     "rationale": "Fits skills and preferences",
                 }
             ]
             return AIMessage(content=[{"type": "text", "text": json.dumps(payload)}])
 
-        summary_text = "Warehouse Associate suits the seeker with a 4-week roadmap."
+        summary_text = "AI Data Ops Associate suits the seeker with a 4-week roadmap."
         return AIMessage(content=[{"type": "text", "text": summary_text}])
 
 
@@ -37,7 +43,7 @@ def test_graph_generates_recommendations(mock_llm):
     )
 
     assert state["role_candidates"], "Expected at least one recommendation"
-    assert state["summary"].startswith("Warehouse Associate")
+    assert state["summary"].startswith("AI Data Ops Associate")
     assert state["roadmap"], "Roadmap should be generated"
 
 
@@ -49,3 +55,108 @@ def test_graph_handles_missing_profile(mock_llm):
     assert "errors" in state
     combined_errors = " ".join(state["errors"])
     assert "Profile inputs missing" in combined_errors or "Unable" in combined_errors
+
+
+class SlowRankingLLM(DummyLLM):
+    def __init__(self, top_role_id="ai-data-ops-associate", ranked=None, summary_text="Summary text.", barrier=None):
+        self.top_role_id = top_role_id
+        self.ranked = ranked or {"title": "Chosen", "match_score": 0.9, "rationale": "LLM"}
+        self.summary_text = summary_text
+        self.barrier = barrier
+        self.overlapped = barrier is not None
+        self.summary_prompts = []
+
+    def _wait_for_other_call(self):
+        if self.barrier is None:
+            time.sleep(0.2)
+            return
+        try:
+            self.barrier.wait()
+        except threading.BrokenBarrierError:
+            self.overlapped = False
+
+    def invoke(self, prompt: str):
+        if "rank the best 3 roles" in prompt:
+            self._wait_for_other_call()
+            payload = [{"role_id": self.top_role_id, **self.ranked}]
+            return AIMessage(content=[{"type": "text", "text": json.dumps(payload)}])
+        self.summary_prompts.append(prompt)
+        self._wait_for_other_call()
+        return AIMessage(content=[{"type": "text", "text": self.summary_text}])
+
+    @property
+    def summaries(self):
+        return len(self.summary_prompts)
+
+
+SPECULATION_PROFILE = {"skills": ["python", "html"], "personality": ["curious"], "preferred_mobility": "low"}
+
+
+def _heuristic_top(profile):
+    return heuristic_recommendations(normalize_profile(profile))[0]
+
+
+def test_speculative_graph_keeps_plan_when_ranking_agrees():
+    top = _heuristic_top(SPECULATION_PROFILE)
+    # Gemini agrees on the role but scores and explains it in its own words.
+    ranked = {"title": top["title"], "match_score": 0.95, "rationale": "Strong web basics for support work."}
+    # Each call waits for the other; the barrier only releases if ranking and summary overlap.
+    llm = SlowRankingLLM(top["role_id"], ranked=ranked, barrier=threading.Barrier(2, timeout=5))
+    with patch("app.graph.nodes.get_llm", return_value=llm):
+        state = build_seeker_graph(speculative=True).invoke({"seeker_profile": SPECULATION_PROFILE})
+
+    assert llm.overlapped
+    assert state["selected_role_id"] == state["speculation"]["role_id"]
+    assert state["role_candidates"][0]["rationale"] == ranked["rationale"]
+    assert state["roadmap"] == state["speculation"]["roadmap"]
+    assert state["summary"] == "Summary text."
+    assert llm.summaries == 1
+    assert "match_score" not in llm.summary_prompts[0] and "rationale" not in llm.summary_prompts[0]
+    assert len(state["llm_usage"]) == 2
+
+
+def test_speculative_template_summary_uses_the_ranked_score():
+    top = _heuristic_top(SPECULATION_PROFILE)
+    ranked = {"title": top["title"], "match_score": 0.95, "rationale": "LLM"}
+    llm = SlowRankingLLM(top["role_id"], ranked=ranked, summary_text="")
+    with patch("app.graph.nodes.get_llm", return_value=llm):
+        state = build_seeker_graph(speculative=True).invoke({"seeker_profile": SPECULATION_PROFILE})
+
+    assert llm.summaries == 1
+    assert "match score 0.95" in state["summary"]
+    assert state["errors"] == ["Gemini summary reply unusable; fallback used"]
+
+
+def test_speculative_graph_recomputes_when_ranking_disagrees():
+    other = next(
+        role["role_id"] for role in ROLE_LIBRARY if role["role_id"] != _heuristic_top(SPECULATION_PROFILE)["role_id"]
+    )
+    llm = SlowRankingLLM(other)
+    with patch("app.graph.nodes.get_llm", return_value=llm):
+        state = build_seeker_graph(speculative=True).invoke({"seeker_profile": SPECULATION_PROFILE})
+    sequential = build_seeker_graph(speculative=False)
+    with patch("app.graph.nodes.get_llm", return_value=SlowRankingLLM(other)):
+        expected = sequential.invoke({"seeker_profile": SPECULATION_PROFILE})
+
+    assert state["selected_role_id"] == other
+    assert state["roadmap"] == expected["roadmap"]
+    assert state["summary"] == expected["summary"]
+    assert llm.summaries == 2
+
+
+def test_llm_recommendations_are_validated_before_reaching_responses():
+    payload = [
+        {"role_id": "ai-data-ops-associate", "title": None, "match_score": 0.9},
+        {"role_id": "made-up-role", "title": "Astronaut", "match_score": 0.8},
+        {"role_id": 42, "title": "Numeric", "match_score": 0.7},
+        {"role_id": "ai-data-ops-associate", "title": "AI Data Ops Associate", "match_score": "1.7", "rationale": None},
+    ]
+    (recommendation,) = _parse_recommendations(json.dumps(payload))
+    assert recommendation == {
+        "role_id": "ai-data-ops-associate",
+        "title": "AI Data Ops Associate",
+        "match_score": 1.0,
+        "rationale": "LLM generated rationale",
+    }
+    with pytest.raises(ValueError):
+        _parse_recommendations(json.dumps(payload[:3]))
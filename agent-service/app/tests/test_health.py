@@ -16,3 +16,4 @@ def test_readiness_endpoint():
     response = client.get("/readiness")
     assert response.status_code == 200
     assert response.json()["status"] == "ready"
+    assert response.json()["llm_circuit"]["state"] in ("closed", "open", "half_open")
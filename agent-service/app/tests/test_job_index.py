@@ -0,0 +1,48 @@
+from app.services.job_index import JobIndex, role_key
+
+
+def _doc(job_id, location, salary_max, status="open", updated_at="2025-11-20T10:00:00.000Z"):
+    return {
+        "_id": job_id,
+        "role": {"_id": "r1", "title": "MERN Support Intern"},
+        "employer": "Sample Employer",
+        "location": location,
+        "salaryMin": salary_max - 5000,
+        "salaryMax": salary_max,
+        "status": status,
+        "updatedAt": updated_at,
+    }
+
+
+def test_top_k_filters_by_location_and_salary():
+    index = JobIndex()
+    index.load([_doc("a", "Kolkata", 18000), _doc("b", "Kolkata", 25000), _doc("c", "Pune", 30000)])
+
+    leads = index.top_k(role_key("MERN Support Intern"), location="kolkata", salary_expectation=20000)
+    assert [lead["job_id"] for lead in leads] == ["b"]
+
+    leads = index.top_k("mern-support-intern", k=2)
+    assert [lead["job_id"] for lead in leads] == ["c", "b"]
+
+
+def test_incremental_load_updates_and_closes_jobs():
+    index = JobIndex()
+    index.load([_doc("a", "Kolkata", 18000), _doc("b", "Kolkata", 25000)])
+    index.load(
+        [_doc("a", "Kolkata", 40000, updated_at="2025-11-21T00:00:00.000Z"), _doc("b", "Kolkata", 25000, status="closed")],
+        full=False,
+    )
+
+    leads = index.top_k("mern-support-intern", location="Kolkata")
+    assert [(lead["job_id"], lead["salary_max"]) for lead in leads] == [("a", 40000)]
+    assert index._watermark == "2025-11-21T00:00:00.000Z"
+
+
+def test_jobs_are_keyed_by_catalog_role_id():
+    index = JobIndex(role_ids={role_key("Edge AI Field Technician"): "edge-ai-field-tech"})
+    doc = {**_doc("a", "Pune", 30000), "role": {"_id": "r3", "title": "Edge AI Field Technician"}}
+    index.load([doc, _doc("b", "Pune", 20000)])
+
+    (lead,) = index.top_k("edge-ai-field-tech")
+    assert lead["role_id"] == "edge-ai-field-tech"
+    assert index.top_k("mern-support-intern")[0]["role_id"] == "mern-support-intern"
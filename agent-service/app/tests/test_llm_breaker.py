@@ -0,0 +1,64 @@
+import pytest
+from langchain_core.messages import AIMessage
+
+from app.graph import nodes
+from app.services import llm
+from app.services.llm import CircuitBreaker, CircuitOpenError
+from app.services.llm_cassette import CassetteMissError
+
+
+def _boom():
+    raise TimeoutError("gemini timed out")
+
+
+def test_breaker_opens_after_failure_rate_and_fails_fast():
+    breaker = CircuitBreaker("test", failure_rate_threshold=0.5, min_calls=2, cooldown_seconds=30)
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            breaker.call(_boom)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "never called")
+
+
+def test_breaker_half_open_probe_closes_on_success(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(llm.time, "monotonic", lambda: clock[0])
+    breaker = CircuitBreaker("test", min_calls=1, cooldown_seconds=10)
+    with pytest.raises(TimeoutError):
+        breaker.call(_boom)
+    assert breaker.snapshot()["retry_in_seconds"] == 10.0
+
+    clock[0] += 11
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+class _ProseLLM:
+    def invoke(self, prompt):
+        return AIMessage(content="I think a warehouse job would suit this person best.")
+
+
+def test_unparseable_replies_from_a_healthy_llm_keep_the_breaker_closed(monkeypatch):
+    breaker = CircuitBreaker("test", failure_rate_threshold=0.5, min_calls=2, cooldown_seconds=30)
+    monkeypatch.setattr(nodes, "get_llm_breaker", lambda: breaker)
+    monkeypatch.setattr(nodes, "get_llm", lambda **_: _ProseLLM())
+
+    for _ in range(4):
+        recommendations, errors = nodes.rank_roles({"skills": ["python"], "personality": []})
+        assert recommendations and "unusable" in errors[0]
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.snapshot()["window_failures"] == 0
+
+
+def test_ignored_exceptions_do_not_count_as_failures():
+    breaker = CircuitBreaker("test", min_calls=1, ignored_exceptions=(CassetteMissError,))
+
+    def miss():
+        raise CassetteMissError("not recorded")
+
+    with pytest.raises(CassetteMissError):
+        breaker.call(miss)
+    assert breaker.state == CircuitBreaker.CLOSED
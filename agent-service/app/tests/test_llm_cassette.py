@@ -0,0 +1,44 @@
+import zlib
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from app.services.llm_cassette import Cassette, CassetteMissError, RecordingLLM, ReplayLLM
+
+
+class FakeGemini:
+    def invoke(self, prompt: str):
+        return AIMessage(
+            content=[{"type": "text", "text": f"echo:{prompt}"}],
+            usage_metadata={"input_tokens": 12, "output_tokens": 3, "total_tokens": 15},
+        )
+
+
+@pytest.mark.parametrize("filename", ["cassette.jsonl", "cassette.jsonl.gz"])
+def test_recorded_exchanges_replay_offline(tmp_path, filename):
+    path = tmp_path / filename
+    recorder = RecordingLLM(FakeGemini(), Cassette(path), "models/gemini-2.5-flash")
+    recorder.invoke("rank the best 3 roles")
+    recorder.cassette.close()
+
+    replay = ReplayLLM(Cassette(path), "models/gemini-2.5-flash", latency="zero")
+    message = replay.invoke("rank the best 3 roles")
+    assert message.content[0]["text"] == "echo:rank the best 3 roles"
+    assert message.usage_metadata["total_tokens"] == 15
+
+    with pytest.raises(CassetteMissError):
+        replay.invoke("a prompt that was never recorded")
+
+
+def test_gzip_recording_session_is_one_compressed_stream(tmp_path):
+    path = tmp_path / "cassette.jsonl.gz"
+    cassette = Cassette(path)
+    recorder = RecordingLLM(FakeGemini(), cassette, "models/gemini-2.5-flash")
+    for index in range(50):
+        recorder.invoke(f"summarize seeker {index}")
+    cassette.close()
+
+    stream = zlib.decompressobj(wbits=31)
+    lines = stream.decompress(path.read_bytes()).splitlines()
+    assert len(lines) == 50 and stream.eof and not stream.unused_data  # no per-exchange gzip members
+    assert Cassette(path).load() == 50
@@ -0,0 +1,38 @@
+import pytest
+
+from app.graph.nodes import _is_ambiguous
+from app.services.model_router import ModelRoute, ModelRouter, _with_fallbacks
+
+
+def _router():
+    summary = _with_fallbacks(
+        "summary",
+        [ModelRoute("summary", "lite", 200), ModelRoute("summary", "flash", 200)],
+        ["flash", "legacy"],
+    )
+    return ModelRouter({"summary": summary})
+
+
+def test_fallback_chain_is_deduplicated_and_keeps_token_cap():
+    chain = _router().chain("summary")
+    assert [route.model_name for route in chain] == ["lite", "flash", "legacy"]
+    assert all(route.max_output_tokens == 200 for route in chain)
+
+
+def test_latency_budget_skips_slow_routes():
+    router = _router()
+    lite, flash, legacy = router.chain("summary")
+    router.record(lite, 900.0, ok=True)
+    router.record(flash, 300.0, ok=True)
+
+    assert [route.model_name for route in router.chain("summary", latency_budget_ms=500)] == ["flash", "legacy"]
+    assert router.stats()["summary:lite"] == {"calls": 1, "errors": 0, "ewma_ms": 900.0, "max_ms": 900.0}
+
+
+@pytest.mark.parametrize("top, runner_up", [(0.7, 0.6), (0.4, 0.3), (0.9, 0.8)])
+def test_one_score_step_is_not_ambiguous(top, runner_up):
+    def recs(*scores):
+        return [{"role_id": str(i), "title": "", "match_score": score, "rationale": ""} for i, score in enumerate(scores)]
+
+    assert not _is_ambiguous(recs(top, runner_up))
+    assert _is_ambiguous(recs(top, round(runner_up + 0.05, 2)))
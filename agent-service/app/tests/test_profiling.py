@@ -0,0 +1,40 @@
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import get_settings
+from app.main import app
+from app.services.profiling import get_profile_store
+from app.tests.test_agents_api import DummyLLM
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def admin_token(monkeypatch, tmp_path):
+    monkeypatch.setattr(get_settings(), "admin_token", "secret")
+    monkeypatch.setattr(get_profile_store(), "directory", tmp_path)
+    return "secret"
+
+
+@patch("app.graph.nodes.get_llm", return_value=DummyLLM())
+def test_profiled_request_stores_artifact_and_node_timings(mock_llm, admin_token):
+    headers = {"X-Profile": "1", "X-Admin-Token": admin_token, "X-Request-ID": "req-profile-1"}
+    payload = {"seeker_profile": {"skills": ["Transport"], "personality": []}}
+    response = client.post("/agents/role-fit", json=payload, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["X-Profile-Artifact"] == "req-profile-1.speedscope.json"
+
+    slowest = client.get("/admin/profiles/slowest", headers={"X-Admin-Token": admin_token}).json()
+    entry = next(item for item in slowest if item["request_id"] == "req-profile-1")
+    assert {"role_scoring", "generate_summary", "graph_total"} <= set(entry["nodes_ms"])
+
+    artifact = client.get("/admin/profiles/req-profile-1", headers={"X-Admin-Token": admin_token})
+    assert artifact.status_code == 200
+    assert "speedscope" in artifact.json()["$schema"]
+
+
+def test_admin_endpoints_require_token(admin_token):
+    assert client.get("/admin/profiles/slowest").status_code == 403
+    assert client.get("/admin/profiles/slowest", headers={"X-Admin-Token": "wrong"}).status_code == 403
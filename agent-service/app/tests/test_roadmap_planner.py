@@ -0,0 +1,52 @@
+import pytest
+
+from app.graph import catalog
+from app.graph.roadmap_planner import _plan, _taught_skills, plan_roadmap
+
+
+def test_known_skills_prune_covered_steps():
+    full = plan_roadmap("mern-support-intern", [])
+    assert [step["title"] for step in full] == ["Frontend refresh", "API ticket drills"]
+    assert set(full[0]) == {"title", "description", "duration_weeks", "resources"}
+
+    personalized = plan_roadmap("mern-support-intern", ["javascript", "html", "react", "tailwind", "excel"])
+    assert [step["title"] for step in personalized] == ["API ticket drills"]
+
+
+@pytest.fixture
+def branching_role(monkeypatch):
+    role = {
+        "role_id": "test-branching",
+        "roadmap": [
+            {"step_id": "a", "title": "A", "description": "", "duration_weeks": 1, "teaches": ["x"]},
+            {"step_id": "b", "title": "B", "description": "", "duration_weeks": 3, "teaches": ["y"]},
+            {"step_id": "c", "title": "C", "description": "", "duration_weeks": 4, "teaches": ["z"], "depends_on": ["a"]},
+        ],
+    }
+    monkeypatch.setitem(catalog._ROLES_BY_ID, role["role_id"], role)
+    yield role
+    _plan.cache_clear()
+    _taught_skills.cache_clear()
+
+
+def test_steps_follow_dependencies_and_critical_path(branching_role):
+    # A -> C is the 5-week critical path, so both run ahead of the 3-week B.
+    assert [step["title"] for step in plan_roadmap("test-branching", [])] == ["A", "C", "B"]
+    # With A covered, C is unblocked and still longer than B.
+    assert [step["title"] for step in plan_roadmap("test-branching", ["x"])] == ["C", "B"]
+
+
+def test_cycles_are_rejected(branching_role):
+    branching_role["roadmap"][0]["depends_on"] = ["c"]
+    with pytest.raises(ValueError):
+        plan_roadmap("test-branching", [])
+
+
+def test_returned_steps_do_not_share_the_cache(branching_role):
+    first = plan_roadmap("test-branching", [])
+    first[0]["title"] = "mutated"
+    first[0]["resources"].append("https://example.com")
+
+    again = plan_roadmap("test-branching", [])
+    assert again[0]["title"] == "A"
+    assert again[0]["resources"] == []
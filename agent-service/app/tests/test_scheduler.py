@@ -0,0 +1,95 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.services.profiling import start_profile_capture
+from app.services.scheduler import AdmissionScheduler, SchedulerOverloaded, TrafficClass
+
+
+def _scheduler(capacity=1, bulk_cap=1, bulk_queue=10):
+    return AdmissionScheduler(
+        capacity,
+        {
+            "interactive": TrafficClass("interactive", weight=4, max_concurrency=capacity, max_queue=10),
+            "bulk": TrafficClass("bulk", weight=1, max_concurrency=bulk_cap, max_queue=bulk_queue),
+        },
+    )
+
+
+def test_weighted_fair_order_favours_interactive_without_starving_bulk():
+    async def scenario():
+        scheduler = _scheduler()
+        order = []
+        await scheduler.acquire("bulk")  # occupy the only slot so everything below queues
+
+        async def job(name, label):
+            await scheduler.acquire(name)
+            order.append(label)
+            scheduler.release(name)
+
+        tasks = [asyncio.create_task(job("bulk", f"b{i}")) for i in range(2)]
+        tasks += [asyncio.create_task(job("interactive", f"i{i}")) for i in range(6)]
+        await asyncio.sleep(0)
+        scheduler.release("bulk")
+        await asyncio.gather(*tasks)
+        return order, scheduler.stats()
+
+    order, stats = asyncio.run(scenario())
+    assert order[:4] == ["i0", "i1", "i2", "i3"]
+    assert order.index("b0") < order.index("i5")
+    assert stats["classes"]["interactive"]["admitted"] == 6
+    assert stats["classes"]["interactive"]["queue_ms_p95"] is not None
+
+
+def test_bulk_respects_concurrency_cap_and_queue_limit():
+    async def scenario():
+        scheduler = _scheduler(capacity=4, bulk_cap=1, bulk_queue=1)
+        await scheduler.acquire("bulk")
+        waiting = asyncio.create_task(scheduler.acquire("bulk"))
+        await asyncio.sleep(0)
+        assert not waiting.done()  # capped even though capacity is free
+        await scheduler.acquire("interactive")  # interactive still gets in
+        with pytest.raises(SchedulerOverloaded):
+            await scheduler.acquire("bulk")
+        scheduler.release("bulk")
+        await waiting
+
+    asyncio.run(scenario())
+
+
+def test_profiled_runs_stay_off_the_event_loop():
+    async def scenario():
+        sessions = start_profile_capture(True)
+        loop_thread = threading.get_ident()
+        worker_thread = await _scheduler().run("interactive", threading.get_ident)
+        return loop_thread, worker_thread, sessions
+
+    loop_thread, worker_thread, sessions = asyncio.run(scenario())
+    assert worker_thread != loop_thread
+    assert len(sessions) == 1
+
+
+def test_traffic_class_comes_from_the_tenant_not_the_header(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app.config import get_settings
+    from app.main import app
+
+    monkeypatch.setattr(get_settings(), "tenant_api_keys", "partner:k-partner")
+    monkeypatch.setattr(get_settings(), "bulk_tenants", "partner")
+    seen = []
+
+    class RecordingScheduler:
+        async def run(self, traffic_class, func, *args):
+            seen.append(traffic_class)
+            return {"normalized_profile": {}}
+
+    monkeypatch.setattr("app.routers.agents.get_scheduler", lambda: RecordingScheduler())
+    client = TestClient(app)
+    payload = {"seeker_profile": {"skills": [], "personality": []}}
+    client.post("/agents/profile", json=payload, headers={"X-Tenant-Key": "k-partner"})
+    client.post("/agents/profile", json=payload, headers={"X-Tenant-Key": "k-partner", "X-Traffic-Class": "interactive"})
+    client.post("/agents/profile", json=payload)
+    client.post("/agents/profile", json=payload, headers={"X-Traffic-Class": "bulk"})
+    assert seen == ["bulk", "bulk", "interactive", "bulk"]
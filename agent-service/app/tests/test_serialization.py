@@ -0,0 +1,22 @@
+import json
+
+from app.core.serialization import dumps, typed_response
+from app.schemas.agents import RoadmapResponse
+
+
+def test_typed_response_fills_model_defaults():
+    response = typed_response(
+        RoadmapResponse,
+        role_id="mern-support-intern",
+        roadmap=[{"title": "Frontend refresh", "description": "React basics", "duration_weeks": 2, "resources": []}],
+        summary=None,
+        email_status=None,
+    )
+    body = json.loads(response.body)
+    assert body["errors"] == []
+    assert body["roadmap"][0]["duration_weeks"] == 2
+    assert response.media_type == "application/json"
+
+
+def test_dumps_keeps_non_ascii_text():
+    assert dumps({"city": "कोलकाता"}) == '{"city":"कोलकाता"}'
@@ -0,0 +1,129 @@
+from unittest.mock import patch
+
+import redis
+
+from fastapi.testclient import TestClient
+from langchain_core.messages import AIMessage
+
+from app.config import get_settings
+from app.graph.nodes import rank_roles
+from app.main import app
+from app.services.usage import (
+    ECONOMY,
+    EXHAUSTED,
+    NORMAL,
+    RedisUsageStore,
+    UsageLedger,
+    capture_usage,
+    resolve_tenant,
+    usage_from_message,
+)
+from app.tests.test_agents_api import DummyLLM
+
+client = TestClient(app)
+
+
+class FakeRedis:
+    """Just the hash/set/pipeline commands the usage store issues, shared by every "worker"."""
+
+    def __init__(self):
+        self.hashes, self.sets, self.fail = {}, {}, False
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def hincrby(self, key, field, amount):
+        self.hashes.setdefault(key, {})[field] = int(self.hashes.get(key, {}).get(field, 0)) + amount
+
+    def hincrbyfloat(self, key, field, amount):
+        self.hashes.setdefault(key, {})[field] = float(self.hashes.get(key, {}).get(field, 0)) + amount
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def expire(self, key, seconds):
+        pass
+
+    def execute(self):
+        if self.fail:
+            raise redis.ConnectionError("down")
+
+    def hgetall(self, key):
+        return {field.encode(): str(value).encode() for field, value in self.hashes.get(key, {}).items()}
+
+    def smembers(self, key):
+        return {member.encode() for member in self.sets.get(key, set())}
+
+
+def _message(total):
+    return AIMessage(content="ok", usage_metadata={"input_tokens": total - 10, "output_tokens": 10, "total_tokens": total})
+
+
+def test_usage_is_priced_and_captured():
+    ledger = UsageLedger()
+    with capture_usage() as captured:
+        ledger.record("acme", usage_from_message("summary", "models/gemini-2.5-flash", "prompt", _message(1010)))
+
+    assert captured[0]["total_tokens"] == 1010 and not captured[0]["estimated"]
+    assert captured[0]["cost_usd"] == round((1000 * 0.30 + 10 * 2.50) / 1_000_000, 6)
+    report = ledger.report()
+    assert report["tenants"]["acme"]["calls"] == 1
+    assert report["routes"]["summary:models/gemini-2.5-flash"]["total_tokens"] == 1010
+
+
+def test_budget_tiers_downgrade_then_fall_back_to_heuristic():
+    ledger = UsageLedger(daily_token_budget=1000, economy_ratio=0.8)
+    assert ledger.tier("acme") == NORMAL
+    ledger.record("acme", usage_from_message("ranking", "m", "p", _message(850)))
+    assert ledger.tier("acme") == ECONOMY
+    ledger.record("acme", usage_from_message("ranking", "m", "p", _message(200)))
+    assert ledger.tier("acme") == EXHAUSTED
+    assert ledger.tier("other") == NORMAL
+
+    llm = DummyLLM()
+    with patch("app.graph.nodes.get_usage_ledger", return_value=ledger), patch(
+        "app.graph.nodes.get_tenant", return_value="acme"
+    ), patch("app.graph.nodes.get_llm", return_value=llm) as get_llm:
+        recommendations, errors = rank_roles({"skills": ["transport"], "personality": []})
+    get_llm.assert_not_called()
+    assert recommendations and "budget" in errors[0]
+
+
+def test_budget_is_shared_across_workers_through_redis():
+    shared = FakeRedis()
+    worker_a = UsageLedger(1000, 0.8, RedisUsageStore(shared))
+    worker_b = UsageLedger(1000, 0.8, RedisUsageStore(shared))
+    worker_a.record("acme", usage_from_message("ranking", "m", "p", _message(600)))
+    worker_b.record("acme", usage_from_message("ranking", "m", "p", _message(500)))
+
+    assert worker_a.tier("acme") == worker_b.tier("acme") == EXHAUSTED
+    report = worker_b.report()
+    assert report["store"] == "redis" and report["tenants"]["acme"]["calls"] == 2
+    assert report["routes"]["ranking:m"]["total_tokens"] == 1100
+
+
+def test_redis_errors_fall_back_to_process_counters():
+    shared = FakeRedis()
+    shared.fail = True
+    ledger = UsageLedger(1000, 0.8, RedisUsageStore(shared))
+    ledger.record("acme", usage_from_message("ranking", "m", "p", _message(900)))
+    assert ledger.tier("acme") == ECONOMY
+
+
+def test_tenants_come_only_from_configured_keys(monkeypatch):
+    monkeypatch.setattr(get_settings(), "tenant_api_keys", "acme:k-acme, globex:k-globex")
+    assert resolve_tenant("k-globex") == "globex"
+    assert resolve_tenant("acme") is None and resolve_tenant(None) is None
+
+
+@patch("app.graph.nodes.get_llm", return_value=DummyLLM())
+def test_request_usage_lands_in_tenant_report(mock_llm, monkeypatch):
+    monkeypatch.setattr(get_settings(), "admin_token", "secret")
+    monkeypatch.setattr(get_settings(), "tenant_api_keys", "usage-test:k-usage")
+    payload = {"seeker_profile": {"skills": ["Transport"], "personality": []}}
+    assert client.post("/agents/role-fit", json=payload, headers={"X-Tenant-Key": "k-usage"}).status_code == 200
+
+    report = client.get("/admin/usage", headers={"X-Admin-Token": "secret"}).json()
+    tenant = report["tenants"]["usage-test"]
+    assert tenant["calls"] == 2 and tenant["total_tokens"] > 0
+    assert tenant["tier"] == NORMAL
@@ -0,0 +1,67 @@
+"""Measure job index build time and top-k query latency on a synthetic job feed.
+
+Run from ``agent-service``::
+
+    python -m benchmarks.bench_job_index --jobs 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from app.services.job_index import JobIndex
+
+ROLES = ["MERN Support Intern", "AI Data Ops Associate", "Edge AI Field Technician", "Warehouse Associate"]
+CITIES = ["Kolkata", "Pune", "Bengaluru", "Delhi", "Chennai", "Jaipur", "Lucknow", "Patna"]
+
+
+def _feed(size: int, rng: random.Random):
+    for index in range(size):
+        salary_min = rng.randrange(8000, 60000, 500)
+        yield {
+            "_id": f"job-{index}",
+            "role": {"_id": "r", "title": rng.choice(ROLES)},
+            "employer": f"Employer {index % 500}",
+            "location": rng.choice(CITIES),
+            "salaryMin": salary_min,
+            "salaryMax": salary_min + rng.randrange(0, 15000, 500),
+            "status": "open",
+            "updatedAt": "2025-11-20T10:00:00.000Z",
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=20_000)
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    index = JobIndex()
+    started = time.perf_counter()
+    index.load(_feed(args.jobs, rng))
+    print(f"full load of {args.jobs} jobs: {(time.perf_counter() - started) * 1e3:.1f} ms")
+
+    started = time.perf_counter()
+    index.load(_feed(args.jobs // 100, rng), full=False)
+    print(f"incremental upsert of {args.jobs // 100} jobs: {(time.perf_counter() - started) * 1e3:.1f} ms")
+
+    queries = [
+        ("mern-support-intern", rng.choice(CITIES + [None]), rng.choice([None, 15000, 30000, 50000]))
+        for _ in range(args.queries)
+    ]
+    latencies = []
+    for role_id, location, salary in queries:
+        started = time.perf_counter()
+        index.top_k(role_id, location=location, salary_expectation=salary, k=5)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e6
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e6
+    print(f"top_k over {args.queries} queries: p50 {p50:.1f} us, p99 {p99:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark the full seeker graph offline by replaying recorded Gemini exchanges.
+
+Record once against live Gemini, then replay as often as needed without network::
+
+    python -m benchmarks.bench_pipeline_replay --record
+    python -m benchmarks.bench_pipeline_replay --latency zero --runs 200
+    python -m benchmarks.bench_pipeline_replay --speculative   # compare against the sequential graph
+
+Replay fails loudly (CassetteMissError -> graph errors) when prompts drift from the recording,
+and any fallback errors are counted so parsing regressions show up next to the latency numbers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+from collections import Counter, defaultdict
+
+SAMPLE_PROFILES = [
+    {"skills": ["JavaScript", "HTML"], "personality": ["curious"], "preferred_mobility": "low"},
+    {"skills": ["Excel", "Python"], "personality": ["analytical"], "preferred_mobility": "medium"},
+    {"skills": ["Networking", "IoT"], "personality": ["hands-on"], "preferred_mobility": "high"},
+    {
+        "skills": ["Python", "HTML"],
+        "personality": ["detail-oriented", "process-driven"],
+        "constraints": {"location": "Kolkata", "salary_expectation": 18000},
+    },
+    {"skills": [], "personality": ["problem-solver"]},
+]
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--record", action="store_true", help="call live Gemini and write the cassette")
+    parser.add_argument("--cassette", default=os.getenv("LLM_CASSETTE_PATH", "cassettes/llm_cassette.jsonl.gz"))
+    parser.add_argument("--latency", choices=["realistic", "zero"], default="realistic")
+    parser.add_argument("--runs", type=int, default=20, help="passes over the sample profiles (replay only)")
+    parser.add_argument("--speculative", action="store_true", help="plan/summarize in parallel with ranking")
+    args = parser.parse_args()
+
+    os.environ["LLM_CASSETTE_MODE"] = "record" if args.record else "replay"
+    os.environ["LLM_CASSETTE_PATH"] = args.cassette
+    os.environ["LLM_REPLAY_LATENCY"] = args.latency
+    os.environ.setdefault("CORE_SERVICE_URL", "")
+    os.environ["SPECULATIVE_PIPELINE"] = "true" if args.speculative else "false"
+
+    from app.graph import build_seeker_graph
+    from app.graph.nodes import speculation_matches_ranking
+    from app.services.profiling import start_node_timings
+
+    graph = build_seeker_graph()
+    runs = 1 if args.record else args.runs
+    node_ms: dict[str, list[float]] = defaultdict(list)
+    errors: Counter[str] = Counter()
+    speculation: Counter[str] = Counter()
+    for _ in range(runs):
+        for profile in SAMPLE_PROFILES:
+            timings = start_node_timings()
+            started = time.perf_counter()
+            state = graph.invoke({"seeker_profile": profile})
+            node_ms["total"].append((time.perf_counter() - started) * 1000)
+            for node, ms in timings.items():
+                node_ms[node].append(ms)
+            errors.update(state.get("errors", []))
+            if args.speculative:
+                plan = state.get("speculation")
+                kept = speculation_matches_ranking(state)
+                speculation["skipped" if plan is None else "kept" if kept else "discarded"] += 1
+
+    print(f"{'node':<24}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}")
+    for node, values in node_ms.items():
+        print(f"{node:<24}{_percentile(values, 0.5):>10.2f}{_percentile(values, 0.95):>10.2f}{statistics.fmean(values):>10.2f}")
+    if speculation:
+        print("speculation: " + ", ".join(f"{outcome} {count}" for outcome, count in speculation.most_common()))
+    for message, count in errors.most_common():
+        print(f"error x{count}: {message}")
+
+
+if __name__ == "__main__":
+    main()
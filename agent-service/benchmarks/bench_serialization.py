@@ -0,0 +1,109 @@
+"""Compare the legacy Pydantic + stdlib JSON response path with the orjson fast path.
+
+Run from ``agent-service``::
+
+    python -m benchmarks.bench_serialization --steps 500 --batch 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.serialization import dumps, typed_response
+from app.schemas.agents import RoadmapResponse, RoleFitResponse
+
+
+def _roadmap_fields(steps: int) -> dict:
+    return {
+        "role_id": "ai-data-ops-associate",
+        "roadmap": [
+            {
+                "title": f"Milestone {index}",
+                "description": "Practice writing Python notebooks that push clean data into Mongo/Redis caches.",
+                "duration_weeks": index % 4 + 1,
+                "resources": ["FastAPI ops guide", "LangChain tooling demos", "Label Studio basics"],
+            }
+            for index in range(steps)
+        ],
+        "summary": "AI Data Ops Associate fits your Excel and Python background. " * 4,
+        "email_status": None,
+        "errors": [],
+    }
+
+
+def _role_fit_fields() -> dict:
+    return {
+        "role_candidates": [
+            {
+                "role_id": f"role-{index}",
+                "title": f"Role {index}",
+                "match_score": 0.9 - index * 0.1,
+                "rationale": "Builds on inventory and transport skills with low mobility — ज़्यादा यात्रा नहीं.",
+            }
+            for index in range(3)
+        ],
+        "selected_role_id": "role-0",
+        "summary": "Role 0 suits the seeker with a 4-week roadmap.",
+        "errors": [],
+    }
+
+
+def _legacy(model, fields: dict) -> bytes:
+    # Endpoint builds the model, FastAPI re-validates it against response_model and
+    # renders with the stdlib encoder.
+    built = model(**fields)
+    validated = model.model_validate(built.model_dump())
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def _fast(model, fields: dict) -> bytes:
+    return typed_response(model, **fields).body
+
+
+def _report(label: str, legacy_seconds: float, fast_seconds: float, runs: int) -> None:
+    print(
+        f"{label:<28} legacy {legacy_seconds / runs * 1e6:10.1f} us   "
+        f"orjson {fast_seconds / runs * 1e6:10.1f} us   speedup x{legacy_seconds / fast_seconds:5.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=500, help="roadmap steps in the large payload")
+    parser.add_argument("--batch", type=int, default=200, help="role-fit responses per batch")
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    roadmap = _roadmap_fields(args.steps)
+    assert json.loads(_legacy(RoadmapResponse, roadmap)) == json.loads(_fast(RoadmapResponse, roadmap))
+    _report(
+        f"roadmap ({args.steps} steps)",
+        timeit.timeit(lambda: _legacy(RoadmapResponse, roadmap), number=args.runs),
+        timeit.timeit(lambda: _fast(RoadmapResponse, roadmap), number=args.runs),
+        args.runs,
+    )
+
+    batch = [_role_fit_fields() for _ in range(args.batch)]
+    _report(
+        f"role-fit batch ({args.batch})",
+        timeit.timeit(lambda: [_legacy(RoleFitResponse, item) for item in batch], number=args.runs),
+        timeit.timeit(lambda: [_fast(RoleFitResponse, item) for item in batch], number=args.runs),
+        args.runs,
+    )
+
+    prompt_payload = {"profile": roadmap, "catalog": batch[:20]}
+    _report(
+        "prompt payload dumps",
+        timeit.timeit(lambda: json.dumps(prompt_payload, ensure_ascii=False), number=args.runs),
+        timeit.timeit(lambda: dumps(prompt_payload), number=args.runs),
+        args.runs,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Compare per-run allocations of partial node updates against the old copy-the-state style.
+
+Run from ``agent-service``::
+
+    python -m benchmarks.bench_state_memory --skills 5000 --history 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+import tracemalloc
+from typing import List, Optional, TypedDict
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, StateGraph
+from loguru import logger
+
+os.environ.setdefault("CORE_SERVICE_URL", "")
+
+from app.graph import nodes  # noqa: E402
+from app.graph.builder import build_seeker_graph  # noqa: E402
+
+
+class _StubLLM:
+    def invoke(self, prompt: str):
+        if "rank the best 3 roles" in prompt:
+            text = '[{"role_id": "ai-data-ops-associate", "title": "AI Data Ops Associate", "match_score": 0.8}]'
+        else:
+            text = "AI Data Ops Associate fits; the roadmap takes five weeks."
+        return AIMessage(content=text)
+
+
+class _CopyingState(TypedDict, total=False):
+    seeker_profile: dict
+    normalized_profile: dict
+    role_candidates: List[dict]
+    selected_role_id: Optional[str]
+    roadmap: List[dict]
+    summary: str
+    job_leads: List[dict]
+    conversation_history: List[str]
+    errors: List[str]
+
+
+def _copying(node):
+    # Pre-reducer behaviour: every node returned {**state, ...} and errors were merged by hand.
+    def wrapper(state):
+        update = node(state)
+        return {**state, **update, "errors": [*state.get("errors", []), *update.get("errors", [])]}
+
+    return wrapper
+
+
+def _build_copying_graph():
+    graph = StateGraph(_CopyingState)
+    order = [
+        ("collect_profile", nodes.collect_profile_node),
+        ("role_scoring", nodes.role_scoring_node),
+        ("roadmap_builder", nodes.roadmap_builder_node),
+        ("generate_summary", nodes.summary_node),
+        ("job_matching", nodes.job_matching_node),
+    ]
+    for name, node in order:
+        graph.add_node(name, _copying(node))
+    graph.set_entry_point(order[0][0])
+    for (current, _), (following, _) in zip(order, order[1:]):
+        graph.add_edge(current, following)
+    graph.add_edge(order[-1][0], END)
+    return graph.compile()
+
+
+def _measure(graph, initial_state: dict, runs: int) -> tuple[float, int]:
+    graph.invoke(initial_state)  # warm caches outside the measurement
+    tracemalloc.start()
+    started = time.perf_counter()
+    for _ in range(runs):
+        tracemalloc.reset_peak()
+        graph.invoke(initial_state)
+    elapsed_ms = (time.perf_counter() - started) * 1000 / runs
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, default=5000)
+    parser.add_argument("--history", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    initial_state = {
+        "seeker_profile": {
+            "skills": [f"skill-{index}" for index in range(args.skills)] + ["python", "excel"],
+            "personality": ["analytical"],
+        },
+        "conversation_history": [f"turn {index}: " + "namaste " * 20 for index in range(args.history)],
+    }
+    logger.remove()  # keep log formatting of the large profile out of the measurement
+    with patch.object(nodes, "get_llm", return_value=_StubLLM()):
+        for label, graph in (("copy-per-node", _build_copying_graph()), ("partial+reducers", build_seeker_graph())):
+            elapsed_ms, peak = _measure(graph, initial_state, args.runs)
+            print(f"{label:<18} {elapsed_ms:8.2f} ms/run   peak traced {peak / 1024:9.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Measure how agent-service throughput scales with the number of pre-forked gunicorn workers.
+
+Starts ``gunicorn -c gunicorn.conf.py`` once per worker count and drives it with a closed-loop
+async HTTP client. Run from ``agent-service`` with the usual env vars exported::
+
+    python -m benchmarks.bench_workers --workers 1 2 4 --path /agents/profile
+
+Without a reachable Gemini key the role-fit/roadmap paths measure the heuristic fallback.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import httpx
+
+PAYLOAD = {
+    "seeker_profile": {
+        "skills": ["Python", "Excel", "Inventory"],
+        "personality": ["analytical"],
+        "preferred_mobility": "medium",
+        "constraints": {"location": "Kolkata", "salary_expectation": 15000},
+    }
+}
+
+
+def _start_server(workers: int, port: int) -> subprocess.Popen:
+    env = {**os.environ, "WEB_CONCURRENCY": str(workers), "AGENT_BIND": f"127.0.0.1:{port}", "LOG_LEVEL": "WARNING"}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "app.main:app", "-c", "gunicorn.conf.py"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("gunicorn did not become healthy within 30s")
+
+
+async def _drive(url: str, method: str, concurrency: int, duration: float) -> tuple[int, int]:
+    completed = failed = 0
+    stop_at = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+
+        async def worker() -> None:
+            nonlocal completed, failed
+            while time.monotonic() < stop_at:
+                try:
+                    if method == "GET":
+                        response = await client.get(url)
+                    else:
+                        response = await client.post(url, json=PAYLOAD)
+                    if response.status_code < 400:
+                        completed += 1
+                    else:
+                        failed += 1
+                except httpx.HTTPError:
+                    failed += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return completed, failed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--path", default="/agents/profile")
+    parser.add_argument("--method", default="POST", choices=["GET", "POST"])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8311)
+    args = parser.parse_args()
+
+    baseline = None
+    for workers in args.workers:
+        process = _start_server(workers, args.port)
+        try:
+            completed, failed = asyncio.run(
+                _drive(f"http://127.0.0.1:{args.port}{args.path}", args.method, args.concurrency, args.duration)
+            )
+        finally:
+            process.send_signal(signal.SIGTERM)
+            process.wait(timeout=60)
+        throughput = completed / args.duration
+        baseline = baseline or throughput
+        print(
+            f"workers={workers:<3} {throughput:9.1f} req/s  scaling x{throughput / baseline:4.2f}  errors={failed}"
+        )
+
+
+if __name__ == "__main__":
+    main()
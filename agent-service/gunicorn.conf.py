@@ -0,0 +1,32 @@
+"""Gunicorn settings for the pre-fork production serving mode (see scripts/start-agent-prod.sh)."""
+
+import multiprocessing
+import os
+
+bind = os.getenv("AGENT_BIND", "0.0.0.0:8001")
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+
+# Import the app (settings, compiled graph, role catalog, job index) once in the master so
+# workers share those pages copy-on-write instead of rebuilding them per process.
+preload_app = True
+
+# Recycle workers periodically to cap slow memory growth; jitter avoids restarting them all at once.
+max_requests = int(os.getenv("WORKER_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("WORKER_MAX_REQUESTS_JITTER", "200"))
+
+# Graceful drain: on SIGTERM/HUP workers stop accepting and get this long to finish in-flight calls.
+graceful_timeout = int(os.getenv("WORKER_GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "60"))
+keepalive = 5
+
+accesslog = None
+loglevel = os.getenv("LOG_LEVEL", "info").lower()
+
+
+def when_ready(server):
+    """Warm shared state in the master after the app is imported and before the first fork."""
+    from app.main import preload_shared_state
+
+    preload_shared_state()
+    server.log.info("Shared catalog and indexes built; forking %s workers", workers)
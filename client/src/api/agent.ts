@@ -6,3 +6,6 @@ export const fetchRoleFit = (profile: SeekerProfile) =>
 
 export const fetchRoadmap = (payload: { seeker_profile?: SeekerProfile; role_id?: string }) =>
   agentClient.post("/agents/roadmap", payload).then((res) => res.data);
+
+export const fetchCatalogRoadmap = (roleId: string) =>
+  agentClient.get(`/agents/roadmaps/${encodeURIComponent(roleId)}`).then((res) => res.data);
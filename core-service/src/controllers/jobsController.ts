@@ -3,7 +3,7 @@ import { JobPosting } from "../schemas/JobPosting";
 import { asyncHandler } from "../utils/asyncHandler";
 
 export const listJobs = asyncHandler(async (req, res) => {
-  const { location, roleId, salaryMin, salaryMax } = req.query;
+  const { location, roleId, salaryMin, salaryMax, updatedSince } = req.query;
   const filter: any = {};
   if (location) filter.location = location;
   if (roleId) filter.role = roleId;
@@ -11,6 +11,14 @@ export const listJobs = asyncHandler(async (req, res) => {
     filter.salaryMin = { $gte: Number(salaryMin) || 0 };
     filter.salaryMax = { $lte: Number(salaryMax) || Infinity };
   }
+  if (updatedSince) {
+    const since = new Date(String(updatedSince));
+    if (Number.isNaN(since.getTime())) {
+      res.status(400).json({ message: "updatedSince must be an ISO 8601 timestamp" });
+      return;
+    }
+    filter.updatedAt = { $gte: since };
+  }
   const jobs = await JobPosting.find(filter).populate("role");
   res.json(jobs);
 });